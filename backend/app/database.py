@@ -2,37 +2,133 @@
 
 This module provides SQLite database connection and helpers
 for storing and retrieving route planning history.
+
+A single WAL-mode connection is opened once per process (at application
+startup, or lazily on first use) and shared by all requests.
 """
 
-import json
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
 
-from .schemas import RoutePlan
+from pydantic import TypeAdapter
+
+from .schemas import HistorySummary, RoutePlan
 
 # Database file path
 DB_DIR = Path(__file__).parent.parent / "data"
 DB_PATH = DB_DIR / "route_history.db"
 
+# Connection tuning applied once when the shared connection is opened
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Reusing the same SQL strings lets sqlite3's statement cache skip re-preparing them
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO route_plans (id, data, created_at)
+    VALUES (?, ?, ?)
+"""
+_SELECT_HISTORY_SQL = """
+    SELECT data FROM route_plans
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+# Extracts only scalar fields in SQLite, so coordinates are never decoded in Python
+_SELECT_SUMMARY_SQL = """
+    SELECT
+        id,
+        json_extract(CAST(data AS TEXT), '$.created_at') AS created_at,
+        json_extract(CAST(data AS TEXT), '$.total_distance_km') AS total_distance_km,
+        json_extract(CAST(data AS TEXT), '$.total_elevation_gain_m') AS total_elevation_gain_m,
+        json_extract(CAST(data AS TEXT), '$.total_duration_min') AS total_duration_min
+    FROM route_plans
+    ORDER BY route_plans.created_at DESC
+    LIMIT ?
+"""
+# Served by the primary key's index
+_SELECT_BY_ID_SQL = "SELECT data FROM route_plans WHERE id = ?"
+
+# Serializes plans straight to UTF-8 bytes (no intermediate str)
+_PLAN_ADAPTER = TypeAdapter(RoutePlan)
 
-def get_db_connection() -> sqlite3.Connection:
-    """Get SQLite database connection.
+_conn: sqlite3.Connection | None = None
+_conn_lock = threading.Lock()
 
-    Creates database file and tables if they don't exist.
+# LRU cache for get_route_plan_by_id; plans are immutable once written
+PLAN_CACHE_SIZE = int(os.getenv("ROUTE_PLAN_CACHE_SIZE", "256"))
+_plan_cache: OrderedDict[str, RoutePlan] = OrderedDict()
+_plan_cache_lock = threading.Lock()
 
-    Returns:
-        SQLite connection object.
+
+def init_database() -> None:
+    """Open the shared database connection and create the schema.
+
+    Safe to call more than once; subsequent calls are no-ops.
     """
-    # Ensure data directory exists
-    DB_DIR.mkdir(parents=True, exist_ok=True)
+    global _conn
+
+    with _conn_lock:
+        if _conn is not None:
+            return
+
+        # Ensure data directory exists
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.Connection(
+            str(DB_PATH),
+            check_same_thread=False,
+            isolation_level=None,  # Autocommit; transactions are explicit
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
 
-    conn = sqlite3.Connection(str(DB_PATH))
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+        _init_database(conn)
+        _conn = conn
 
-    # Create table if not exists
-    _init_database(conn)
 
-    return conn
+def close_database() -> None:
+    """Close the shared database connection if it is open."""
+    global _conn
+
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+
+@contextmanager
+def borrow_conn() -> Iterator[sqlite3.Connection]:
+    """Borrow the shared SQLite connection.
+
+    The connection is opened on first use if ``init_database`` has not
+    been called yet. Access is serialized with a lock because a single
+    ``sqlite3.Connection`` must not be used from two threads at once.
+
+    Yields:
+        Shared SQLite connection.
+    """
+    if _conn is None:
+        init_database()
+
+    with _conn_lock:
+        assert _conn is not None
+        yield _conn
 
 
 def _init_database(conn: sqlite3.Connection) -> None:
@@ -44,15 +140,38 @@ def _init_database(conn: sqlite3.Connection) -> None:
     conn.execute("""
         CREATE TABLE IF NOT EXISTS route_plans (
             id TEXT PRIMARY KEY,
-            data TEXT NOT NULL,
-            created_at TIMESTAMP NOT NULL
+            data BLOB NOT NULL,
+            created_at INTEGER NOT NULL  -- Epoch milliseconds (UTC)
         )
     """)
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_created_at
         ON route_plans(created_at DESC)
     """)
-    conn.commit()
+    # Older databases stored created_at as TIMESTAMP text; convert those rows
+    # so ordering compares integers only.
+    conn.execute("""
+        UPDATE route_plans
+        SET created_at = CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER)
+        WHERE typeof(created_at) = 'text'
+    """)
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    """Convert a datetime to the integer sort key stored in created_at.
+
+    Naive datetimes are treated as UTC, matching how SQLite interprets
+    legacy TIMESTAMP text during migration.
+
+    Args:
+        value: Datetime to convert.
+
+    Returns:
+        Milliseconds since the Unix epoch.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return round(value.timestamp() * 1000)
 
 
 def save_route_plan(plan: RoutePlan) -> None:
@@ -61,21 +180,15 @@ def save_route_plan(plan: RoutePlan) -> None:
     Args:
         plan: RoutePlan to save.
     """
-    conn = get_db_connection()
-    try:
-        # Serialize plan to JSON
-        plan_json = plan.model_dump_json()
-
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO route_plans (id, data, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (plan.id, plan_json, plan.created_at),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    # Serialize plan to JSON bytes, stored as a BLOB
+    plan_json = _PLAN_ADAPTER.dump_json(plan)
+
+    with borrow_conn() as conn:
+        conn.execute(_INSERT_SQL, (plan.id, plan_json, _to_epoch_ms(plan.created_at)))
+
+    # INSERT OR REPLACE may overwrite an existing plan
+    with _plan_cache_lock:
+        _plan_cache.pop(plan.id, None)
 
 
 def get_route_history(limit: int = 50) -> list[RoutePlan]:
@@ -87,48 +200,80 @@ def get_route_history(limit: int = 50) -> list[RoutePlan]:
     Returns:
         List of RoutePlan objects, most recent first.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute(
-            """
-            SELECT data FROM route_plans
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
+    with borrow_conn() as conn:
+        rows = conn.execute(_SELECT_HISTORY_SQL, (limit,)).fetchall()
+
+    # Parse and validate in one pass inside pydantic-core.
+    # Rows written before the BLOB switch are TEXT; both decode the same way.
+    return [RoutePlan.model_validate_json(row["data"]) for row in rows]
+
+
+def get_route_history_raw(limit: int = 50) -> list[bytes]:
+    """Retrieve route planning history as stored JSON documents.
+
+    Unlike ``get_route_history`` the rows are not decoded, so callers can
+    forward them to clients without re-validating or re-serializing.
+
+    Args:
+        limit: Maximum number of plans to retrieve.
+
+    Returns:
+        List of JSON-encoded RoutePlan documents, most recent first.
+    """
+    with borrow_conn() as conn:
+        rows = conn.execute(_SELECT_HISTORY_SQL, (limit,)).fetchall()
+
+    # Rows written before the BLOB switch come back as str
+    return [data if isinstance(data, bytes) else data.encode() for (data,) in rows]
+
 
-        plans = []
-        for row in cursor:
-            plan_data = json.loads(row["data"])
-            plans.append(RoutePlan(**plan_data))
+def get_route_history_summary(limit: int = 50) -> list[HistorySummary]:
+    """Retrieve summaries of recent route plans.
 
-        return plans
-    finally:
-        conn.close()
+    Only id, timestamp and totals are read, without parsing full plans.
+
+    Args:
+        limit: Maximum number of summaries to retrieve.
+
+    Returns:
+        List of HistorySummary objects, most recent first.
+    """
+    with borrow_conn() as conn:
+        rows = conn.execute(_SELECT_SUMMARY_SQL, (limit,)).fetchall()
+
+    return [HistorySummary(**dict(row)) for row in rows]
 
 
 def get_route_plan_by_id(plan_id: str) -> RoutePlan | None:
     """Retrieve a specific route plan by ID.
 
+    Results are served from an in-memory LRU cache when possible.
+
     Args:
         plan_id: Route plan ID.
 
     Returns:
         RoutePlan if found, None otherwise.
     """
-    conn = get_db_connection()
-    try:
-        cursor = conn.execute(
-            "SELECT data FROM route_plans WHERE id = ?",
-            (plan_id,),
-        )
-        row = cursor.fetchone()
+    with _plan_cache_lock:
+        cached = _plan_cache.get(plan_id)
+        if cached is not None:
+            _plan_cache.move_to_end(plan_id)
+            return cached
+
+    with borrow_conn() as conn:
+        row = conn.execute(_SELECT_BY_ID_SQL, (plan_id,)).fetchone()
+
+    if row is None:
+        return None
+
+    plan = RoutePlan.model_validate_json(row["data"])
 
-        if row is None:
-            return None
+    if PLAN_CACHE_SIZE > 0:
+        with _plan_cache_lock:
+            _plan_cache[plan_id] = plan
+            _plan_cache.move_to_end(plan_id)
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
 
-        plan_data = json.loads(row["data"])
-        return RoutePlan(**plan_data)
-    finally:
-        conn.close()
+    return plan
@@ -12,8 +12,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from planner.http import close_http_client
+
+from .database import close_database, init_database
 from .routers import geocode, history, plan, strava, weather
+from .services.claude import close_claude_service
 
 # Load environment variables from project root .env file
 project_root = Path(__file__).parent.parent.parent
@@ -40,10 +45,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if not os.getenv("ANTHROPIC_API_KEY"):
         print("WARNING: ANTHROPIC_API_KEY not set. Claude API calls will fail.")
 
+    # Open the shared database connection once for the whole process
+    init_database()
+
     yield
 
     # Shutdown
     print("Shutting down Cycling Route Planner API...")
+    await close_claude_service()
+    await close_http_client()
+    close_database()
 
 
 # Create FastAPI application
@@ -76,6 +87,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (history, elevation profiles).
+# Starlette leaves text/event-stream uncompressed so SSE frames are not held back.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include routers
 app.include_router(plan.router)
 app.include_router(weather.router)
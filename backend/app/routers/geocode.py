@@ -4,6 +4,8 @@ This module provides the GET /api/geocode endpoint for converting
 addresses and place names to geographic coordinates.
 """
 
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException, Query
 
 from planner.geocode import Geocoder, GeocodingError
@@ -13,6 +15,19 @@ from ..schemas import GeocodeResponse, Location
 router = APIRouter(prefix="/api", tags=["geocode"])
 
 
+@lru_cache(maxsize=1)
+def get_geocoder() -> Geocoder:
+    """Return the process-wide Geocoder.
+
+    Construction failures (e.g. missing ORS_API_KEY) are not cached, so a
+    later call retries once the environment is fixed.
+
+    Returns:
+        Shared Geocoder instance.
+    """
+    return Geocoder()
+
+
 @router.get("/geocode", response_model=GeocodeResponse)
 async def geocode_address(
     query: str = Query(..., min_length=1, description="Address or place name to search"),
@@ -34,7 +49,8 @@ async def geocode_address(
         HTTPException: If geocoding fails or no results found.
     """
     try:
-        geocoder = Geocoder()
+        # Reuse the shared geocoder
+        geocoder = get_geocoder()
         planner_locations = await geocoder.geocode(query, country)
 
         # Convert planner.schemas.Location to backend.app.schemas.Location
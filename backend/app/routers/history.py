@@ -4,10 +4,10 @@ This module provides the GET /api/history endpoint for retrieving
 past route planning history.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
-from ..database import get_route_history, get_route_plan_by_id
-from ..schemas import HistoryResponse, RoutePlan
+from ..database import get_route_history_raw, get_route_history_summary, get_route_plan_by_id
+from ..schemas import HistoryResponse, HistorySummaryResponse, RoutePlan
 
 router = APIRouter(prefix="/api", tags=["history"])
 
@@ -15,27 +15,59 @@ router = APIRouter(prefix="/api", tags=["history"])
 @router.get("/history", response_model=HistoryResponse)
 async def get_history(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of plans to retrieve"),
-) -> HistoryResponse:
+) -> Response:
     """Retrieve route planning history.
 
+    Stored plans are already JSON produced from validated RoutePlan models,
+    so the response body is assembled from them directly.
+
     Args:
         limit: Maximum number of plans to return (1-100).
 
     Returns:
-        HistoryResponse with list of past route plans.
+        JSON response shaped like HistoryResponse with list of past route plans.
 
     Raises:
         HTTPException: If database query fails.
     """
     try:
-        plans = get_route_history(limit=limit)
-        return HistoryResponse(data=plans)
+        plans = get_route_history_raw(limit=limit)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve history: {str(e)}",
         ) from e
 
+    return Response(
+        content=b'{"data":[' + b",".join(plans) + b"]}",
+        media_type="application/json",
+    )
+
+
+@router.get("/history/summary", response_model=HistorySummaryResponse)
+async def get_history_summary(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of plans to retrieve"),
+) -> HistorySummaryResponse:
+    """Retrieve lightweight summaries of past route plans.
+
+    Args:
+        limit: Maximum number of summaries to return (1-100).
+
+    Returns:
+        HistorySummaryResponse with id, timestamp and totals per plan.
+
+    Raises:
+        HTTPException: If database query fails.
+    """
+    try:
+        summaries = get_route_history_summary(limit=limit)
+        return HistorySummaryResponse(data=summaries)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve history summary: {str(e)}",
+        ) from e
+
 
 @router.get("/history/{plan_id}", response_model=RoutePlan)
 async def get_plan_by_id(plan_id: str) -> RoutePlan:
@@ -4,14 +4,20 @@ This module provides the POST /api/plan endpoint for generating
 cycling route plans with LLM analysis via SSE streaming.
 """
 
+import os
+import re
+import time
 import uuid
 from collections.abc import AsyncIterator
 from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
 from planner import RouteGenerator, WeatherClient
+from planner.schemas import Location as PlannerLocation
+from planner.schemas import RoutePreferences as PlannerPreferences
 
 from ..database import save_route_plan
 from ..schemas import (
@@ -21,10 +27,47 @@ from ..schemas import (
     WeatherForecast,
 )
 from ..services.claude import ClaudeService, get_claude_service
-from ..services.streaming import format_sse, stream_error
+from ..services.streaming import STREAM_OPEN, batch_tokens, format_sse, stream_error
 
 router = APIRouter(prefix="/api", tags=["planning"])
 
+# Gear keyword scan: one regex pass, group number identifies the condition
+_GEAR_KEYWORDS_RE = re.compile("(雨|降水)|(寒|低温)|(暑|高温)|(風)")
+_CONDITIONAL_GEAR: dict[int, tuple[str, ...]] = {
+    1: ("レインウェア", "防水バッグ"),
+    2: ("ウィンドブレーカー", "アームウォーマー"),
+    3: ("日焼け止め",),
+    4: ("アイウェア",),
+}
+# Keywords are at most two characters, so one carried-over character is
+# enough to catch matches split across streamed chunks
+_GEAR_KEYWORD_OVERLAP = 1
+
+
+@lru_cache(maxsize=1)
+def get_route_generator() -> RouteGenerator:
+    """Return the process-wide RouteGenerator.
+
+    Construction failures (e.g. missing ORS_API_KEY) are not cached, so a
+    later call retries once the environment is fixed.
+
+    Returns:
+        Shared RouteGenerator instance.
+    """
+    return RouteGenerator()
+
+
+@lru_cache(maxsize=1)
+def get_weather_client() -> WeatherClient:
+    """Return the process-wide WeatherClient.
+
+    Sharing one instance lets requests reuse its cache of forecast responses.
+
+    Returns:
+        Shared WeatherClient instance.
+    """
+    return WeatherClient()
+
 
 @router.post("/plan")
 async def plan_route(
@@ -33,8 +76,11 @@ async def plan_route(
 ) -> StreamingResponse:
     """Generate cycling route plan with LLM analysis.
 
-    This endpoint streams results via Server-Sent Events (SSE):
-    - event: route_data -> Route coordinates and elevation
+    This endpoint streams results via Server-Sent Events (SSE). An SSE
+    comment is flushed first so the connection opens before route
+    generation finishes, followed by:
+    - event: route_segment -> Route coordinates and elevation, one per segment
+    - event: route_data_end -> Route totals
     - event: weather -> Weather forecasts
     - event: token -> LLM analysis text (streaming)
     - event: done -> Completion signal
@@ -47,41 +93,40 @@ async def plan_route(
         StreamingResponse with SSE events.
     """
 
-    async def generate_stream() -> AsyncIterator[str]:
-        try:
-            # Initialize route generator
-            route_generator = RouteGenerator()
-
-            # Convert backend schemas to planner schemas for compatibility
-            from planner.schemas import Location as PlannerLocation
-            from planner.schemas import RoutePreferences as PlannerPreferences
+    # Convert backend schemas to planner schemas for compatibility.
+    # The request is already validated, so skip re-validation.
+    planner_origin = PlannerLocation.model_construct(
+        lat=request.origin.lat,
+        lng=request.origin.lng,
+        name=request.origin.name,
+    )
+    planner_dest = PlannerLocation.model_construct(
+        lat=request.destination.lat,
+        lng=request.destination.lng,
+        name=request.destination.name,
+    )
+    planner_prefs = PlannerPreferences.model_construct(
+        difficulty=request.preferences.difficulty,
+        avoid_traffic=request.preferences.avoid_traffic,
+        prefer_scenic=request.preferences.prefer_scenic,
+        max_distance_km=request.preferences.max_distance_km,
+        max_elevation_gain_m=request.preferences.max_elevation_gain_m,
+        is_round_trip=request.preferences.is_round_trip,
+    )
 
-            planner_origin = PlannerLocation(
-                lat=request.origin.lat,
-                lng=request.origin.lng,
-                name=request.origin.name,
-            )
-            planner_dest = PlannerLocation(
-                lat=request.destination.lat,
-                lng=request.destination.lng,
-                name=request.destination.name,
-            )
-            planner_prefs = PlannerPreferences(
-                difficulty=request.preferences.difficulty,
-                avoid_traffic=request.preferences.avoid_traffic,
-                prefer_scenic=request.preferences.prefer_scenic,
-                max_distance_km=request.preferences.max_distance_km,
-                max_elevation_gain_m=request.preferences.max_elevation_gain_m,
-                is_round_trip=request.preferences.is_round_trip,
-            )
+    # Convert waypoints to planner schema
+    planner_waypoints = None
+    if request.waypoints:
+        planner_waypoints = [
+            PlannerLocation.model_construct(lat=wp.lat, lng=wp.lng, name=wp.name)
+            for wp in request.waypoints
+        ]
 
-            # Convert waypoints to planner schema
-            planner_waypoints = None
-            if request.waypoints:
-                planner_waypoints = [
-                    PlannerLocation(lat=wp.lat, lng=wp.lng, name=wp.name)
-                    for wp in request.waypoints
-                ]
+    async def generate_stream() -> AsyncIterator[bytes]:
+        yield STREAM_OPEN
+        try:
+            # Reuse the shared route generator
+            route_generator = get_route_generator()
 
             # Generate route(s) using real OpenRouteService API
             if request.preferences.is_round_trip:
@@ -116,33 +161,41 @@ async def plan_route(
                     for seg in planner_segments
                 ]
 
+            # Calculate totals in a single pass over segments
+            total_distance_km = 0.0
+            total_elevation_gain_m = 0.0
+            total_duration_min = 0
+            for seg in segments:
+                total_distance_km += seg.distance_km
+                total_elevation_gain_m += seg.elevation_gain_m
+                total_duration_min += seg.estimated_duration_min
+
+            # Send route data one segment per event, before waiting on weather,
+            # so the client can draw the route as soon as it is generated
+            for seg in segments:
+                yield format_sse("route_segment", seg)
+            yield format_sse(
+                "route_data_end",
+                {
+                    "segment_count": len(segments),
+                    "total_distance_km": total_distance_km,
+                    "total_elevation_gain_m": total_elevation_gain_m,
+                    "total_duration_min": total_duration_min,
+                },
+            )
+
             # Get weather forecasts using real WeatherClient
             weather_forecasts = await _get_route_weather(
                 segments=segments,
                 departure_time=request.departure_time,
             )
 
-            # Calculate totals
-            total_distance_km = sum(seg.distance_km for seg in segments)
-            total_elevation_gain_m = sum(seg.elevation_gain_m for seg in segments)
-            total_duration_min = sum(seg.estimated_duration_min for seg in segments)
-
-            # Send route data
-            route_data = {
-                "segments": [seg.model_dump(mode='json') for seg in segments],
-                "total_distance_km": total_distance_km,
-                "total_elevation_gain_m": total_elevation_gain_m,
-                "total_duration_min": total_duration_min,
-            }
-            yield format_sse("route_data", route_data)
-
             # Send weather data
-            weather_data = [w.model_dump(mode='json') for w in weather_forecasts]
-            yield format_sse("weather", weather_data)
+            yield format_sse("weather", weather_forecasts)
 
             # Stream LLM analysis
             llm_analysis_parts: list[str] = []
-            async for token in claude_service.analyze_route_streaming(
+            llm_stream = claude_service.analyze_route_streaming(
                 segments=segments,
                 weather_forecasts=weather_forecasts,
                 total_distance_km=total_distance_km,
@@ -150,9 +203,13 @@ async def plan_route(
                 difficulty=request.preferences.difficulty,
                 waypoints=request.waypoints,
                 fitness_profile=request.fitness_profile,
-            ):
-                llm_analysis_parts.append(token)
-                yield format_sse("token", token)
+            )
+            # Tokens are coalesced to cut per-event framing overhead
+            gear_scanner = _GearKeywordScanner()
+            async for chunk in batch_tokens(llm_stream):
+                llm_analysis_parts.append(chunk)
+                gear_scanner.feed(chunk)
+                yield format_sse("token", chunk)
 
             # Combine full LLM analysis
             llm_analysis = "".join(llm_analysis_parts)
@@ -160,11 +217,11 @@ async def plan_route(
             # Extract warnings and gear recommendations from LLM analysis
             # Simple heuristic-based extraction (can be enhanced)
             warnings = _extract_warnings(llm_analysis, weather_forecasts)
-            recommended_gear = _extract_gear_recommendations(llm_analysis)
+            recommended_gear = _recommend_gear(gear_scanner.matched)
 
             # Create and save route plan
             plan = RoutePlan(
-                id=str(uuid.uuid4()),
+                id=_new_plan_id(),
                 segments=segments,
                 total_distance_km=total_distance_km,
                 total_elevation_gain_m=total_elevation_gain_m,
@@ -219,15 +276,13 @@ async def _get_route_weather(
         departure_time = departure_time.replace(tzinfo=timezone.utc)
 
     # Extract locations from route segments
-    from planner.schemas import Location as PlannerLocation
-
     locations = []
     for segment in segments:
         if segment.coordinates:
             # Sample every 10th coordinate or use all if less than 10
             step = max(1, len(segment.coordinates) // 10)
             for lat, lng in segment.coordinates[::step]:
-                locations.append(PlannerLocation(lat=lat, lng=lng))
+                locations.append(PlannerLocation.model_construct(lat=lat, lng=lng, name=None))
 
     if not locations:
         return []
@@ -237,7 +292,7 @@ async def _get_route_weather(
     duration_hours = max(1, total_duration_min // 60)
 
     # Get weather forecasts using WeatherClient
-    weather_client = WeatherClient()
+    weather_client = get_weather_client()
     planner_forecasts = await weather_client.get_route_forecast(
         locations=locations,
         start_time=departure_time,
@@ -261,6 +316,27 @@ async def _get_route_weather(
     return weather_forecasts
 
 
+def _new_plan_id() -> str:
+    """Generate a time-ordered plan ID (UUIDv7, RFC 9562).
+
+    IDs sort by creation time, so inserts into the route_plans primary key
+    index append instead of landing on random B-tree pages.
+
+    Returns:
+        UUIDv7 string.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # Version 7
+        | ((rand >> 62) & 0xFFF) << 64  # rand_a
+        | 0b10 << 62  # RFC 4122 variant
+        | (rand & 0x3FFF_FFFF_FFFF_FFFF)  # rand_b
+    )
+    return str(uuid.UUID(int=value))
+
+
 def _extract_warnings(analysis: str, forecasts: list[WeatherForecast]) -> list[str]:
     """Extract warnings from LLM analysis and weather data.
 
@@ -271,36 +347,74 @@ def _extract_warnings(analysis: str, forecasts: list[WeatherForecast]) -> list[s
     Returns:
         List of warning messages.
     """
-    warnings = []
+    warnings: list[str] = []
+
+    if not forecasts:
+        return warnings
+
+    # Collect wind/rain/temperature extremes in a single pass
+    first = forecasts[0]
+    max_wind = first.wind_speed
+    max_precip = first.precipitation_probability
+    max_temp = min_temp = first.temperature
+    for f in forecasts:
+        if f.wind_speed > max_wind:
+            max_wind = f.wind_speed
+        if f.precipitation_probability > max_precip:
+            max_precip = f.precipitation_probability
+        temp = f.temperature
+        if temp > max_temp:
+            max_temp = temp
+        elif temp < min_temp:
+            min_temp = temp
 
     # Check for high winds
-    max_wind = max((f.wind_speed for f in forecasts), default=0)
     if max_wind > 10:
         warnings.append(f"強風警告: 最大風速{max_wind:.1f}m/s")
 
     # Check for rain
-    max_precip = max((f.precipitation_probability for f in forecasts), default=0)
     if max_precip > 50:
         warnings.append(f"降雨注意: 降水確率{max_precip:.0f}%")
 
     # Check for high temperature
-    max_temp = max((f.temperature for f in forecasts), default=0)
     if max_temp > 30:
         warnings.append(f"熱中症注意: 最高気温{max_temp:.1f}°C")
 
     # Low temperature
-    min_temp = min((f.temperature for f in forecasts), default=100)
     if min_temp < 5:
         warnings.append(f"低温注意: 最低気温{min_temp:.1f}°C")
 
     return warnings
 
 
-def _extract_gear_recommendations(analysis: str) -> list[str]:
-    """Extract gear recommendations from LLM analysis.
+class _GearKeywordScanner:
+    """Tracks gear keyword matches incrementally as analysis text streams in."""
+
+    def __init__(self) -> None:
+        """Initialize with no matched conditions."""
+        self.matched: set[int] = set()
+        self._tail = ""
+
+    def feed(self, text: str) -> None:
+        """Scan the next piece of text for gear keywords.
+
+        Args:
+            text: Next chunk of analysis text.
+        """
+        if len(self.matched) == len(_CONDITIONAL_GEAR):
+            return
+
+        window = self._tail + text
+        for match in _GEAR_KEYWORDS_RE.finditer(window):
+            self.matched.add(match.lastindex or 0)
+        self._tail = window[-_GEAR_KEYWORD_OVERLAP:]
+
+
+def _recommend_gear(matched: set[int]) -> list[str]:
+    """Build the gear list for the matched keyword conditions.
 
     Args:
-        analysis: LLM analysis text.
+        matched: Regex group numbers of the matched conditions.
 
     Returns:
         List of recommended gear.
@@ -308,28 +422,19 @@ def _extract_gear_recommendations(analysis: str) -> list[str]:
     # Basic gear recommendations (can be enhanced with NLP)
     gear = ["ヘルメット", "グローブ", "補給食", "水分"]
 
-    # Add conditional gear based on keywords in analysis
-    if "雨" in analysis or "降水" in analysis:
-        gear.extend(["レインウェア", "防水バッグ"])
-
-    if "寒" in analysis or "低温" in analysis:
-        gear.extend(["ウィンドブレーカー", "アームウォーマー"])
-
-    if "暑" in analysis or "高温" in analysis:
-        gear.append("日焼け止め")
-
-    if "風" in analysis:
-        gear.append("アイウェア")
+    for group, items in _CONDITIONAL_GEAR.items():
+        if group in matched:
+            gear.extend(items)
 
     return gear
 
 
 async def _generate_round_trip_route(
-    route_generator: "RouteGenerator",
-    origin: "PlannerLocation",
-    destination: "PlannerLocation",
-    preferences: "PlannerPreferences",
-    waypoints: "list[PlannerLocation] | None" = None,
+    route_generator: RouteGenerator,
+    origin: PlannerLocation,
+    destination: PlannerLocation,
+    preferences: PlannerPreferences,
+    waypoints: list[PlannerLocation] | None = None,
 ) -> list[RouteSegment]:
     """Generate round trip route with different outbound and return paths.
 
@@ -345,10 +450,6 @@ async def _generate_round_trip_route(
     import logging
     logger = logging.getLogger(__name__)
 
-    # Import here to avoid circular imports
-    from planner.schemas import Location as PlannerLocation
-    from planner.schemas import RoutePreferences as PlannerPreferences
-
     # Generate outbound route (origin -> waypoints -> destination)
     outbound_planner_segments = await route_generator.generate_route(
         origin=origin,
@@ -162,6 +162,28 @@ class HistoryResponse(BaseModel):
     data: list[RoutePlan]
 
 
+class HistorySummary(BaseModel):
+    """Lightweight summary of a stored route plan for list views."""
+
+    id: str = Field(..., description="Unique plan identifier")
+    created_at: datetime = Field(..., description="Plan creation timestamp")
+    total_distance_km: float = Field(
+        ..., ge=0, description="Total route distance in kilometers"
+    )
+    total_elevation_gain_m: float = Field(
+        ..., ge=0, description="Total elevation gain in meters"
+    )
+    total_duration_min: int = Field(
+        ..., ge=0, description="Estimated total duration in minutes"
+    )
+
+
+class HistorySummaryResponse(BaseModel):
+    """Response wrapper for route history summaries."""
+
+    data: list[HistorySummary]
+
+
 class GeocodeResponse(BaseModel):
     """Response wrapper for geocoding results."""
 
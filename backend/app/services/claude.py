@@ -4,18 +4,97 @@ This module handles streaming interactions with the Anthropic Claude API
 to provide intelligent route analysis, recommendations, and warnings.
 """
 
+import math
 import os
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from anthropic import AsyncAnthropic
-from anthropic.types import TextDelta
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
 from ..schemas import Location, RouteSegment, WeatherForecast
 
 # Model configuration
 CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
 
+# Timezone used for all times shown in the prompt
+JST = ZoneInfo("Asia/Tokyo")
+
+# Number of forecasts listed individually in the weather summary
+WEATHER_SUMMARY_LIMIT = 5
+
+# Upper bound on forecasts sampled for the prompt's wind averages
+MAX_PROMPT_FORECASTS = 32
+
+
+@lru_cache(maxsize=256)
+def _format_system_prompt(
+    total_distance_km: float,
+    total_elevation_gain_m: float,
+    difficulty: str,
+    surface_summary: str,
+    segment_count: int,
+    waypoint_info: str,
+    weather_summary: str,
+    avg_wind_speed: float,
+    avg_wind_direction: int,
+    fitness_section: str,
+    personalized_advice: str,
+) -> str:
+    """Render the system prompt.
+
+    Pure function of its (hashable) arguments, so identical replans reuse
+    the rendered text.
+
+    Args:
+        total_distance_km: Total distance.
+        total_elevation_gain_m: Total elevation gain.
+        difficulty: Difficulty level.
+        surface_summary: Comma-separated surface types.
+        segment_count: Number of route segments.
+        waypoint_info: Pre-rendered waypoint line, or empty string.
+        weather_summary: Pre-rendered weather summary.
+        avg_wind_speed: Average wind speed in m/s.
+        avg_wind_direction: Average wind direction in degrees.
+        fitness_section: Pre-rendered fitness profile section, or empty string.
+        personalized_advice: Extra output item for personalization, or empty string.
+
+    Returns:
+        Formatted system prompt for Claude.
+    """
+    return f"""あなたは経験豊富なサイクリングルートアドバイザーです。
+以下の情報を総合的に分析し、サイクリストに役立つアドバイスを提供してください。
+
+## ルート情報
+- 総距離: {total_distance_km:.1f}km
+- 獲得標高: {total_elevation_gain_m:.0f}m
+- 希望難易度: {difficulty}
+- 路面タイプ: {surface_summary}
+- セグメント数: {segment_count}
+{waypoint_info}
+
+## 天気情報（すべて日本時間 JST）
+{weather_summary}
+
+## 風の状況
+- 平均風速: {avg_wind_speed:.1f}m/s
+- 平均風向: {avg_wind_direction:.0f}度
+{fitness_section}
+## 提供すべき情報（日本語で）
+1. **ルートの難易度評価**: 距離、獲得標高、路面タイプから総合評価
+2. **補給ポイント推奨**: 距離と標高から休憩・補給が必要な地点を提案
+3. **危険箇所の警告**: 強風区間、急勾配、悪天候のタイミングなど
+4. **推奨装備**: 天気・気温・風に応じたウェア、補給食、工具など
+5. **走行時のアドバイス**: ペース配分、風向きとルート方向の関係、時間帯別注意点
+{personalized_advice}
+注意点:
+- すべての時刻は日本時間（JST）で表示されています
+- 具体的で実用的なアドバイスを提供してください
+- 安全性を最優先してください
+- 日本のサイクリング文化に即した表現を使ってください
+"""
+
 
 class ClaudeService:
     """Service for interacting with Claude API for route analysis."""
@@ -34,7 +113,14 @@ class ClaudeService:
             raise ValueError(
                 "ANTHROPIC_API_KEY not found. Set it in environment or pass to constructor."
             )
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        # Keep-alive pool shared by all requests through the service singleton,
+        # so repeat analyses skip the TCP/TLS handshake
+        self.client = AsyncAnthropic(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
 
     async def analyze_route_streaming(
         self,
@@ -75,19 +161,18 @@ class ClaudeService:
             "サイクリストにとって有益なアドバイスを日本語で提供してください。"
         )
 
-        async with self.client.messages.stream(
+        # Raw event stream: no MessageStream accumulation for a text-only response
+        stream = await self.client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=4096,
             system=system_prompt,
             messages=[{"role": "user", "content": user_message}],
-        ) as stream:
-            async for event in stream:
-                # Extract text from content block delta events
-                if hasattr(event, "type") and event.type == "content_block_delta":
-                    if hasattr(event, "delta"):
-                        delta = event.delta
-                        if isinstance(delta, TextDelta) and hasattr(delta, "text"):
-                            yield delta.text
+            stream=True,
+        )
+        async for event in stream:
+            # Extract text from content block delta events
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                yield event.delta.text
 
     def _build_system_prompt(
         self,
@@ -117,20 +202,28 @@ class ClaudeService:
         weather_summary = self._summarize_weather(weather_forecasts)
 
         # Route details
-        surface_types = [seg.surface_type for seg in segments]
-        surface_summary = ", ".join(set(surface_types))
-
-        # Average wind analysis
-        avg_wind_speed = (
-            sum(w.wind_speed for w in weather_forecasts) / len(weather_forecasts)
-            if weather_forecasts
-            else 0
-        )
-        avg_wind_direction = (
-            sum(w.wind_direction for w in weather_forecasts) / len(weather_forecasts)
-            if weather_forecasts
-            else 0
-        )
+        surface_summary = ", ".join(sorted({seg.surface_type for seg in segments}))
+
+        # Long forecast lists are sampled at an even stride to bound the work
+        wind_samples = weather_forecasts
+        if len(wind_samples) > MAX_PROMPT_FORECASTS:
+            stride = -(-len(wind_samples) // MAX_PROMPT_FORECASTS)  # ceil division
+            wind_samples = wind_samples[::stride]
+
+        # Average wind analysis in one pass. Direction is a circular quantity,
+        # so average unit vectors rather than degrees (350° and 10° -> 0°).
+        avg_wind_speed = 0.0
+        avg_wind_direction = 0
+        if wind_samples:
+            speed_sum = sin_sum = cos_sum = 0.0
+            for w in wind_samples:
+                speed_sum += w.wind_speed
+                rad = math.radians(w.wind_direction)
+                sin_sum += math.sin(rad)
+                cos_sum += math.cos(rad)
+            avg_wind_speed = speed_sum / len(wind_samples)
+            # Round before wrapping so e.g. 359.9999 reads as 0, not 360
+            avg_wind_direction = round(math.degrees(math.atan2(sin_sum, cos_sum))) % 360
 
         # Waypoint info
         waypoint_info = ""
@@ -162,38 +255,19 @@ class ClaudeService:
                 "ライダーの実績データに基づいた個別のアドバイス\n"
             )
 
-        prompt = f"""あなたは経験豊富なサイクリングルートアドバイザーです。
-以下の情報を総合的に分析し、サイクリストに役立つアドバイスを提供してください。
-
-## ルート情報
-- 総距離: {total_distance_km:.1f}km
-- 獲得標高: {total_elevation_gain_m:.0f}m
-- 希望難易度: {difficulty}
-- 路面タイプ: {surface_summary}
-- セグメント数: {len(segments)}
-{waypoint_info}
-
-## 天気情報（すべて日本時間 JST）
-{weather_summary}
-
-## 風の状況
-- 平均風速: {avg_wind_speed:.1f}m/s
-- 平均風向: {avg_wind_direction:.0f}度
-{fitness_section}
-## 提供すべき情報（日本語で）
-1. **ルートの難易度評価**: 距離、獲得標高、路面タイプから総合評価
-2. **補給ポイント推奨**: 距離と標高から休憩・補給が必要な地点を提案
-3. **危険箇所の警告**: 強風区間、急勾配、悪天候のタイミングなど
-4. **推奨装備**: 天気・気温・風に応じたウェア、補給食、工具など
-5. **走行時のアドバイス**: ペース配分、風向きとルート方向の関係、時間帯別注意点
-{personalized_advice}
-注意点:
-- すべての時刻は日本時間（JST）で表示されています
-- 具体的で実用的なアドバイスを提供してください
-- 安全性を最優先してください
-- 日本のサイクリング文化に即した表現を使ってください
-"""
-        return prompt
+        return _format_system_prompt(
+            total_distance_km=total_distance_km,
+            total_elevation_gain_m=total_elevation_gain_m,
+            difficulty=difficulty,
+            surface_summary=surface_summary,
+            segment_count=len(segments),
+            waypoint_info=waypoint_info,
+            weather_summary=weather_summary,
+            avg_wind_speed=avg_wind_speed,
+            avg_wind_direction=avg_wind_direction,
+            fitness_section=fitness_section,
+            personalized_advice=personalized_advice,
+        )
 
     def _summarize_weather(self, forecasts: list[WeatherForecast]) -> str:
         """Summarize weather forecasts into human-readable text.
@@ -208,11 +282,12 @@ class ClaudeService:
             return "天気情報なし"
 
         lines = []
-        jst = ZoneInfo("Asia/Tokyo")
-        for i, forecast in enumerate(forecasts):
-            # Convert UTC to JST for display
-            jst_time = forecast.time.astimezone(jst)
-            time_str = jst_time.strftime("%m/%d %H:%M")
+        # Limit to first 5 forecasts in summary
+        for forecast in forecasts[:WEATHER_SUMMARY_LIMIT]:
+            # Convert UTC to JST for display; plain int formatting is
+            # much cheaper than strftime for this fixed layout
+            t = forecast.time.astimezone(JST)
+            time_str = f"{t.month:02d}/{t.day:02d} {t.hour:02d}:{t.minute:02d}"
             temp = forecast.temperature
             wind = forecast.wind_speed
             precip = forecast.precipitation_probability
@@ -223,19 +298,35 @@ class ClaudeService:
                 f"風速{wind:.1f}m/s, 降水確率{precip:.0f}%"
             )
 
-            # Limit to first 5 forecasts in summary
-            if i >= 4:
-                if len(forecasts) > 5:
-                    lines.append(f"- ...他{len(forecasts) - 5}件")
-                break
+        remaining = len(forecasts) - WEATHER_SUMMARY_LIMIT
+        if remaining > 0:
+            lines.append(f"- ...他{remaining}件")
 
         return "\n".join(lines)
 
 
+_claude_service: ClaudeService | None = None
+
+
 async def get_claude_service() -> ClaudeService:
     """Dependency injection for ClaudeService.
 
+    A single instance (and therefore a single pooled HTTP client) is shared
+    across requests. It is created on first use so that a missing API key
+    only fails the requests that need Claude.
+
     Returns:
         Configured ClaudeService instance.
     """
-    return ClaudeService()
+    global _claude_service
+    if _claude_service is None:
+        _claude_service = ClaudeService()
+    return _claude_service
+
+
+async def close_claude_service() -> None:
+    """Close the shared ClaudeService HTTP client, if one was created."""
+    global _claude_service
+    if _claude_service is not None:
+        await _claude_service.client.close()
+        _claude_service = None
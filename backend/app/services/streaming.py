@@ -4,61 +4,204 @@ This module provides helpers for streaming route planning results
 to the frontend using SSE format.
 """
 
-import json
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 
-def format_sse(event: str, data: Any) -> str:
+from ..schemas import WeatherForecast
+
+_WEATHER_LIST_ADAPTER = TypeAdapter(list[WeatherForecast])
+
+# list[Model] adapters, built once per element type
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {WeatherForecast: _WEATHER_LIST_ADAPTER}
+
+
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for lists of ``model``.
+
+    Args:
+        model: Pydantic model class of the list elements.
+
+    Returns:
+        TypeAdapter for ``list[model]``.
+    """
+    adapter = _LIST_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def _event_prefix(event: str) -> bytes:
+    """Build the SSE framing that precedes an event's JSON payload.
+
+    Args:
+        event: Event type name.
+
+    Returns:
+        ``event:`` line plus the start of the ``data:`` envelope.
+    """
+    return b"event: " + event.encode() + b'\ndata: {"type":' + to_json(event) + b',"data":'
+
+
+# Pre-encoded framing for the events this app sends; others are built per call
+_EVENT_PREFIXES: dict[str, bytes] = {
+    event: _event_prefix(event)
+    for event in ("route_segment", "route_data_end", "weather", "token", "done", "error")
+}
+_EVENT_SUFFIX = b"}\n\n"
+
+# SSE comment sent before any work starts. Clients ignore comment lines, but
+# it puts the response headers and first byte on the wire immediately.
+STREAM_OPEN = b": stream open\n\n"
+
+
+def format_sse(event: str, data: Any) -> bytes:
     """Format data as Server-Sent Events message.
 
     Args:
         event: Event type name.
-        data: Data payload (will be JSON-serialized if not a string).
+        data: Data payload. ``bytes`` are treated as already-encoded JSON
+            and embedded as-is. Pydantic models and lists of models are
+            serialized with their compiled schema serializers; anything
+            else is JSON-serialized.
 
     Returns:
-        Formatted SSE message string.
+        UTF-8 encoded SSE message, ready to send without further encoding.
     """
+    if isinstance(data, bytes):
+        payload = data
+    elif isinstance(data, str):
+        # Hot path for LLM tokens: plain string escape, no fallback handling
+        payload = to_json(data)
+    elif isinstance(data, BaseModel):
+        payload = data.__pydantic_serializer__.to_json(data)
+    elif isinstance(data, list) and data and isinstance(data[0], BaseModel):
+        payload = _list_adapter(type(data[0])).dump_json(data)
+    else:
+        payload = to_json(data, fallback=str)
+
     # Wrap data in envelope with type field for frontend compatibility
-    envelope = {"type": event, "data": data}
-    data_json = json.dumps(envelope, ensure_ascii=False, default=str)
+    prefix = _EVENT_PREFIXES.get(event) or _event_prefix(event)
+    return prefix + payload + _EVENT_SUFFIX
+
 
-    return f"data: {data_json}\n\n"
+async def batch_tokens(
+    tokens: AsyncIterator[str],
+    max_chars: int = 4096,
+    flush_interval_s: float = 0.12,
+) -> AsyncIterator[str]:
+    """Coalesce streamed text tokens into larger chunks.
+
+    Tokens are read by a background task into a queue. Buffered text is
+    emitted when it reaches ``max_chars`` or when ``flush_interval_s``
+    elapses since the last flush, even if the source is momentarily
+    stalled. Any remainder is emitted when the source is exhausted, and
+    errors raised by the source are re-raised to the caller.
+
+    Args:
+        tokens: Async iterator of text tokens.
+        max_chars: Buffer size (in characters) that triggers a flush.
+        flush_interval_s: Maximum time to hold buffered text, in seconds.
+
+    Yields:
+        Concatenated text chunks.
+    """
+    queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for token in tokens:
+                await queue.put(token)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline = loop.time() + flush_interval_s
+
+    try:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=max(0.0, deadline - loop.time())
+                    )
+                except TimeoutError:
+                    # Ticker: flush whatever arrived during this interval
+                    if buffer:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        buffered_chars = 0
+                    deadline = loop.time() + flush_interval_s
+                    continue
+
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            buffer.append(item)
+            buffered_chars += len(item)
+            if buffered_chars >= max_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                deadline = loop.time() + flush_interval_s
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        producer.cancel()
 
 
 async def stream_route_planning(
     route_data: dict[str, Any],
-    weather_data: list[dict[str, Any]],
+    weather_data: list[WeatherForecast],
     llm_stream: AsyncIterator[str],
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """Stream route planning results as SSE.
 
     This function orchestrates the streaming of route data, weather forecasts,
     and LLM analysis in SSE format.
 
     Args:
-        route_data: Route segments and elevation data.
+        route_data: Route segments and totals. Each segment is sent as a
+            ``route_segment`` event, followed by a ``route_data_end`` event
+            carrying the segment count and remaining totals.
         weather_data: Weather forecasts along the route.
         llm_stream: Async iterator of LLM text chunks.
 
     Yields:
         SSE-formatted messages.
     """
-    # Send route data first
-    yield format_sse("route_data", route_data)
+    # Send route data first, one segment per event
+    segments = route_data.get("segments", [])
+    for segment in segments:
+        yield format_sse("route_segment", segment)
+    totals = {key: value for key, value in route_data.items() if key != "segments"}
+    yield format_sse("route_data_end", {"segment_count": len(segments), **totals})
 
-    # Send weather data
-    yield format_sse("weather", weather_data)
+    # Send weather data, encoded as one list by pydantic-core
+    yield format_sse("weather", _WEATHER_LIST_ADAPTER.dump_json(weather_data))
 
     # Stream LLM analysis tokens
-    async for token in llm_stream:
-        yield format_sse("token", token)
+    async for chunk in batch_tokens(llm_stream):
+        yield format_sse("token", chunk)
 
     # Send completion event
     yield format_sse("done", {"status": "complete"})
 
 
-async def stream_error(error_message: str) -> AsyncIterator[str]:
+async def stream_error(error_message: str) -> AsyncIterator[bytes]:
     """Stream error message as SSE.
 
     Args:
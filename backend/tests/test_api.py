@@ -140,6 +140,16 @@ async def test_get_history_with_limit(client: AsyncClient) -> None:
     assert len(data["data"]) <= 10
 
 
+@pytest.mark.asyncio
+async def test_get_history_summary(client: AsyncClient) -> None:
+    """Test history summary endpoint is not shadowed by the plan ID route."""
+    response = await client.get("/api/history/summary?limit=5")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data["data"], list)
+    assert len(data["data"]) <= 5
+
+
 @pytest.mark.asyncio
 async def test_get_plan_by_id_not_found(client: AsyncClient) -> None:
     """Test retrieving non-existent plan by ID."""
@@ -195,17 +205,40 @@ async def test_plan_route_streaming(
         if line.strip():
             events.append(line)
 
-    # Should have route_data, weather, token(s), and done events
-    assert len(events) >= 4
+    # Should have route_segment(s), route_data_end, weather, token(s), and done events
+    assert len(events) >= 5
 
     # Check event types
     event_types = [e.split("\n")[0].replace("event: ", "") for e in events if e.startswith("event:")]
-    assert "route_data" in event_types
+    assert "route_segment" in event_types
+    assert "route_data_end" in event_types
     assert "weather" in event_types
     assert "token" in event_types
     assert "done" in event_types
 
 
+@pytest.mark.asyncio
+async def test_large_responses_are_gzipped(client: AsyncClient) -> None:
+    """Test JSON responses above the size threshold are gzip-encoded."""
+    response = await client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "paths" in response.json()
+
+
+def test_geocoder_is_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the geocode endpoint reuses one Geocoder instance."""
+    from backend.app.routers.geocode import get_geocoder
+
+    monkeypatch.setenv("ORS_API_KEY", "test-key")
+    get_geocoder.cache_clear()
+    try:
+        assert get_geocoder() is get_geocoder()
+    finally:
+        get_geocoder.cache_clear()
+
+
 @pytest.mark.asyncio
 async def test_plan_request_validation(client: AsyncClient) -> None:
     """Test plan request with invalid data."""
@@ -0,0 +1,181 @@
+"""Tests for the Claude analysis service."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from backend.app.schemas import WeatherForecast
+from backend.app.services.claude import ClaudeService
+
+
+class _FakeMessages:
+    """Stand-in for ``AsyncAnthropic.messages`` returning canned events."""
+
+    def __init__(self, events: list[SimpleNamespace]) -> None:
+        self.events = events
+        self.kwargs: dict[str, Any] = {}
+
+    async def create(self, **kwargs: Any) -> AsyncIterator[SimpleNamespace]:
+        self.kwargs = kwargs
+
+        async def stream() -> AsyncIterator[SimpleNamespace]:
+            for event in self.events:
+                yield event
+
+        return stream()
+
+
+async def test_analyze_route_streaming_yields_text_deltas() -> None:
+    """Test only text deltas are yielded from the raw event stream."""
+    events = [
+        SimpleNamespace(type="message_start"),
+        SimpleNamespace(type="content_block_start"),
+        SimpleNamespace(
+            type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="ルート")
+        ),
+        SimpleNamespace(
+            type="content_block_delta",
+            delta=SimpleNamespace(type="input_json_delta", partial_json="{}"),
+        ),
+        SimpleNamespace(
+            type="content_block_delta", delta=SimpleNamespace(type="text_delta", text="分析")
+        ),
+        SimpleNamespace(type="message_stop"),
+    ]
+    service = ClaudeService(api_key="test-key")
+    messages = _FakeMessages(events)
+    service.client = SimpleNamespace(messages=messages)  # type: ignore[assignment]
+
+    chunks = [
+        chunk
+        async for chunk in service.analyze_route_streaming(
+            segments=[],
+            weather_forecasts=[],
+            total_distance_km=42.0,
+            total_elevation_gain_m=340.0,
+            difficulty="moderate",
+        )
+    ]
+
+    assert chunks == ["ルート", "分析"]
+    assert messages.kwargs["stream"] is True
+
+
+async def test_analyze_route_streaming_sends_single_system_prompt() -> None:
+    """Test the instructions and route context are sent as one system string."""
+    service = ClaudeService(api_key="test-key")
+    messages = _FakeMessages([])
+    service.client = SimpleNamespace(messages=messages)  # type: ignore[assignment]
+
+    async for _ in service.analyze_route_streaming(
+        segments=[],
+        weather_forecasts=[],
+        total_distance_km=42.0,
+        total_elevation_gain_m=340.0,
+        difficulty="moderate",
+    ):
+        pass
+
+    system = messages.kwargs["system"]
+    assert isinstance(system, str)
+    assert system.startswith("あなたは経験豊富なサイクリングルートアドバイザーです。")
+    assert "総距離: 42.0km" in system
+
+
+def test_build_system_prompt_wind_direction_is_circular_mean() -> None:
+    """Test wind directions either side of north average to north."""
+    forecasts = [
+        WeatherForecast(
+            time=datetime(2025, 3, 15, hour, 0, tzinfo=UTC),
+            temperature=12.0,
+            wind_speed=speed,
+            wind_direction=direction,
+            precipitation_probability=10.0,
+            weather_code=0,
+            description="快晴",
+        )
+        for hour, speed, direction in [(7, 2.0, 350.0), (8, 4.0, 10.0)]
+    ]
+    service = ClaudeService(api_key="test-key")
+
+    prompt = service._build_system_prompt(
+        segments=[],
+        weather_forecasts=forecasts,
+        total_distance_km=42.0,
+        total_elevation_gain_m=340.0,
+        difficulty="moderate",
+    )
+
+    assert "平均風速: 3.0m/s" in prompt
+    assert "平均風向: 0度" in prompt
+
+
+def test_build_system_prompt_samples_long_forecast_lists() -> None:
+    """Test long forecast lists are sampled for the wind averages."""
+    forecasts = [
+        WeatherForecast(
+            time=datetime(2025, 3, 15, 0, 0, tzinfo=UTC),
+            temperature=12.0,
+            wind_speed=float(i),
+            wind_direction=90.0,
+            precipitation_probability=10.0,
+            weather_code=0,
+            description="快晴",
+        )
+        for i in range(100)
+    ]
+    service = ClaudeService(api_key="test-key")
+
+    prompt = service._build_system_prompt(
+        segments=[],
+        weather_forecasts=forecasts,
+        total_distance_km=42.0,
+        total_elevation_gain_m=340.0,
+        difficulty="moderate",
+    )
+
+    # Every 4th forecast (0, 4, ..., 96) is sampled
+    assert "平均風速: 48.0m/s" in prompt
+    assert "平均風向: 90度" in prompt
+    assert "他95件" in prompt
+
+
+def test_build_system_prompt_reuses_rendered_context() -> None:
+    """Test identical inputs are served from the rendered-context cache."""
+    service = ClaudeService(api_key="test-key")
+    kwargs: dict[str, Any] = {
+        "segments": [],
+        "weather_forecasts": [],
+        "total_distance_km": 42.0,
+        "total_elevation_gain_m": 340.0,
+        "difficulty": "moderate",
+    }
+
+    first = service._build_system_prompt(**kwargs)
+    second = service._build_system_prompt(**kwargs)
+
+    assert second is first
+
+
+def test_summarize_weather_formats_jst_times() -> None:
+    """Test summary lines show JST times and the number of omitted rows."""
+    forecasts = [
+        WeatherForecast(
+            time=datetime(2025, 3, 14, 22 + i, 5, tzinfo=UTC),
+            temperature=12.0,
+            wind_speed=3.0,
+            wind_direction=90.0,
+            precipitation_probability=20.0,
+            weather_code=0,
+            description="快晴",
+        )
+        for i in range(2)
+    ] * 4
+    service = ClaudeService(api_key="test-key")
+
+    lines = service._summarize_weather(forecasts).split("\n")
+
+    assert lines[0] == "- 03/15 07:05: 快晴, 12.0°C, 風速3.0m/s, 降水確率20%"
+    assert lines[1].startswith("- 03/15 08:05:")
+    assert lines[5:] == ["- ...他3件"]
@@ -0,0 +1,174 @@
+"""Tests for route history persistence.
+
+Each test runs against a temporary SQLite file.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.app import database
+from backend.app.schemas import RoutePlan, RouteSegment, WeatherForecast
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Point the database module at a temporary file.
+
+    Args:
+        tmp_path: Pytest temporary directory.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Yields:
+        None while the temporary database is active.
+    """
+    database.close_database()
+    monkeypatch.setattr(database, "DB_DIR", tmp_path)
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "route_history.db")
+    yield
+    database.close_database()
+
+
+def _make_plan(plan_id: str, created_at: datetime) -> RoutePlan:
+    """Build a small route plan for persistence tests.
+
+    Args:
+        plan_id: Plan identifier.
+        created_at: Plan creation timestamp.
+
+    Returns:
+        RoutePlan instance.
+    """
+    return RoutePlan(
+        id=plan_id,
+        segments=[
+            RouteSegment(
+                coordinates=[(34.573, 135.483), (34.396, 135.757)],
+                elevations=[10.0, 350.0],
+                distance_km=42.0,
+                elevation_gain_m=340.0,
+                elevation_loss_m=0.0,
+                estimated_duration_min=150,
+                surface_type="paved",
+            )
+        ],
+        total_distance_km=42.0,
+        total_elevation_gain_m=340.0,
+        total_duration_min=150,
+        weather_forecasts=[
+            WeatherForecast(
+                time=datetime(2025, 3, 15, 7, 0),
+                temperature=12.0,
+                wind_speed=4.0,
+                wind_direction=180.0,
+                precipitation_probability=10.0,
+                weather_code=0,
+                description="快晴",
+            )
+        ],
+        llm_analysis="ルート分析",
+        warnings=[],
+        recommended_gear=["ヘルメット"],
+        created_at=created_at,
+    )
+
+
+def test_save_and_get_plan_by_id() -> None:
+    """Test a saved plan round-trips through the database."""
+    plan = _make_plan("plan-1", datetime(2025, 3, 15, 6, 0))
+    database.save_route_plan(plan)
+
+    loaded = database.get_route_plan_by_id("plan-1")
+
+    assert loaded == plan
+
+
+def test_get_plan_by_id_missing() -> None:
+    """Test unknown IDs return None."""
+    assert database.get_route_plan_by_id("missing") is None
+
+
+def test_get_route_history_order_and_limit() -> None:
+    """Test history is returned newest first and honors the limit."""
+    for i in range(3):
+        database.save_route_plan(_make_plan(f"plan-{i}", datetime(2025, 3, 15, i, 0)))
+
+    history = database.get_route_history(limit=2)
+
+    assert [plan.id for plan in history] == ["plan-2", "plan-1"]
+
+
+def test_get_plan_by_id_cache_invalidated_on_save() -> None:
+    """Test overwriting a plan evicts the cached copy."""
+    database.save_route_plan(_make_plan("plan-1", datetime(2025, 3, 15, 6, 0)))
+    first = database.get_route_plan_by_id("plan-1")
+    assert database.get_route_plan_by_id("plan-1") is first
+
+    updated = _make_plan("plan-1", datetime(2025, 3, 15, 6, 0))
+    updated.llm_analysis = "更新済み"
+    database.save_route_plan(updated)
+
+    loaded = database.get_route_plan_by_id("plan-1")
+    assert loaded is not None
+    assert loaded.llm_analysis == "更新済み"
+
+
+def test_get_plan_by_id_cache_evicts_lru(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the plan cache stays within its size limit."""
+    monkeypatch.setattr(database, "PLAN_CACHE_SIZE", 2)
+    for i in range(3):
+        database.save_route_plan(_make_plan(f"plan-{i}", datetime(2025, 3, 15, i, 0)))
+        database.get_route_plan_by_id(f"plan-{i}")
+
+    assert list(database._plan_cache) == ["plan-1", "plan-2"]
+
+
+def test_get_route_history_raw_matches_decoded() -> None:
+    """Test raw history rows decode to the same plans as get_route_history."""
+    for i in range(2):
+        database.save_route_plan(_make_plan(f"plan-{i}", datetime(2025, 3, 15, i, 0)))
+
+    raw = database.get_route_history_raw(limit=10)
+
+    assert all(isinstance(row, bytes) for row in raw)
+    assert [RoutePlan.model_validate_json(row) for row in raw] == database.get_route_history(
+        limit=10
+    )
+
+
+def test_legacy_text_timestamps_are_migrated() -> None:
+    """Test TIMESTAMP text rows are converted so ordering stays correct."""
+    database.save_route_plan(_make_plan("new", datetime(2025, 3, 15, 12, 0)))
+    with database.borrow_conn() as conn:
+        conn.execute(
+            "INSERT INTO route_plans (id, data, created_at) VALUES (?, ?, ?)",
+            (
+                "legacy",
+                _make_plan("legacy", datetime(2025, 3, 15, 6, 0)).model_dump_json(),
+                "2025-03-15 06:00:00",
+            ),
+        )
+    database.close_database()
+
+    history = database.get_route_history(limit=10)
+
+    assert [plan.id for plan in history] == ["new", "legacy"]
+    with database.borrow_conn() as conn:
+        types = {row[0] for row in conn.execute("SELECT typeof(created_at) FROM route_plans")}
+    assert types == {"integer"}
+
+
+def test_get_route_history_summary() -> None:
+    """Test summaries carry totals without loading full plans."""
+    for i in range(2):
+        database.save_route_plan(_make_plan(f"plan-{i}", datetime(2025, 3, 15, i, 0)))
+
+    summaries = database.get_route_history_summary(limit=10)
+
+    assert [s.id for s in summaries] == ["plan-1", "plan-0"]
+    assert summaries[0].created_at == datetime(2025, 3, 15, 1, 0)
+    assert summaries[0].total_distance_km == 42.0
+    assert summaries[0].total_elevation_gain_m == 340.0
+    assert summaries[0].total_duration_min == 150
@@ -0,0 +1,163 @@
+"""Unit tests for route planning helpers in the plan router."""
+
+import inspect
+import time
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.app.routers import plan
+from backend.app.routers.plan import (
+    _extract_warnings,
+    _GearKeywordScanner,
+    _new_plan_id,
+    _recommend_gear,
+    plan_route,
+)
+from backend.app.schemas import Location, PlanRequest, RoutePreferences, WeatherForecast
+from backend.app.services.streaming import STREAM_OPEN
+
+
+def _forecast(
+    temperature: float = 20.0,
+    wind_speed: float = 3.0,
+    precipitation_probability: float = 10.0,
+) -> WeatherForecast:
+    """Build a weather forecast with overridable values.
+
+    Args:
+        temperature: Temperature in Celsius.
+        wind_speed: Wind speed in m/s.
+        precipitation_probability: Precipitation probability percentage.
+
+    Returns:
+        WeatherForecast instance.
+    """
+    return WeatherForecast(
+        time=datetime(2025, 3, 15, 7, 0),
+        temperature=temperature,
+        wind_speed=wind_speed,
+        wind_direction=180.0,
+        precipitation_probability=precipitation_probability,
+        weather_code=1,
+        description="晴れ",
+    )
+
+
+def test_extract_warnings_no_forecasts() -> None:
+    """Test no warnings are produced without weather data."""
+    assert _extract_warnings("", []) == []
+
+
+def test_extract_warnings_calm_weather() -> None:
+    """Test mild weather produces no warnings."""
+    assert _extract_warnings("", [_forecast(), _forecast(temperature=25.0)]) == []
+
+
+def test_extract_warnings_all_conditions() -> None:
+    """Test each threshold produces its warning using the extreme value."""
+    forecasts = [
+        _forecast(temperature=2.0, wind_speed=4.0, precipitation_probability=30.0),
+        _forecast(temperature=32.5, wind_speed=12.3, precipitation_probability=80.0),
+        _forecast(temperature=18.0, wind_speed=6.0, precipitation_probability=40.0),
+    ]
+
+    warnings = _extract_warnings("", forecasts)
+
+    assert warnings == [
+        "強風警告: 最大風速12.3m/s",
+        "降雨注意: 降水確率80%",
+        "熱中症注意: 最高気温32.5°C",
+        "低温注意: 最低気温2.0°C",
+    ]
+
+
+def test_recommend_gear_basic() -> None:
+    """Test analysis without keywords yields only basic gear."""
+    scanner = _GearKeywordScanner()
+    scanner.feed("快適なルートです")
+
+    assert _recommend_gear(scanner.matched) == [
+        "ヘルメット",
+        "グローブ",
+        "補給食",
+        "水分",
+    ]
+
+
+def test_recommend_gear_keywords() -> None:
+    """Test keyword matches add conditional gear in a fixed order."""
+    scanner = _GearKeywordScanner()
+    scanner.feed("午後は強い風と降水の可能性。朝は寒くなります。")
+    gear = _recommend_gear(scanner.matched)
+
+    assert gear[4:] == [
+        "レインウェア",
+        "防水バッグ",
+        "ウィンドブレーカー",
+        "アームウォーマー",
+        "アイウェア",
+    ]
+
+
+def test_new_plan_id_is_time_ordered_uuid7() -> None:
+    """Test plan IDs are valid UUIDv7 values that sort by creation time."""
+    first = _new_plan_id()
+    time.sleep(0.002)
+    second = _new_plan_id()
+
+    parsed = uuid.UUID(first)
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+    assert first < second
+
+
+def test_gear_keyword_scanner_matches_across_chunks() -> None:
+    """Test keywords split across streamed chunks are still detected."""
+    scanner = _GearKeywordScanner()
+    for chunk in ["明日は降", "水確率が高く", "、気温も低", "温です"]:
+        scanner.feed(chunk)
+
+    assert scanner.matched == {1, 2}
+
+
+async def test_plan_route_streams_from_async_generator() -> None:
+    """Test the SSE body is an async generator with proxy buffering disabled.
+
+    A sync iterator would be run in Starlette's threadpool, one hop per event.
+    """
+    request = PlanRequest(
+        origin=Location(lat=34.573, lng=135.483),
+        destination=Location(lat=34.396, lng=135.757),
+        preferences=RoutePreferences(difficulty="moderate"),
+        departure_time=datetime(2025, 3, 15, 7, 0),
+    )
+
+    response = await plan_route(request, claude_service=MagicMock())
+
+    assert inspect.isasyncgen(response.body_iterator)
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
+    await response.body_iterator.aclose()
+
+
+async def test_plan_route_flushes_before_route_generation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the stream opens with an SSE comment before any route work."""
+    route_generator = MagicMock()
+    monkeypatch.setattr(plan, "get_route_generator", route_generator)
+    request = PlanRequest(
+        origin=Location(lat=34.573, lng=135.483),
+        destination=Location(lat=34.396, lng=135.757),
+        preferences=RoutePreferences(difficulty="moderate"),
+        departure_time=datetime(2025, 3, 15, 7, 0),
+    )
+
+    response = await plan_route(request, claude_service=MagicMock())
+
+    assert await anext(response.body_iterator) == STREAM_OPEN
+    route_generator.assert_not_called()
+    await response.body_iterator.aclose()
@@ -0,0 +1,140 @@
+"""Tests for SSE formatting helpers."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+
+from backend.app.schemas import WeatherForecast
+from backend.app.services.streaming import batch_tokens, format_sse, stream_route_planning
+
+
+def _parse(message: bytes) -> dict:
+    """Parse a single SSE message into its JSON envelope.
+
+    Args:
+        message: Formatted SSE message.
+
+    Returns:
+        Decoded envelope.
+    """
+    event_line, data_line = message.decode().removesuffix("\n\n").split("\n")
+    assert event_line.startswith("event: ")
+    assert data_line.startswith("data: ")
+    envelope = json.loads(data_line[len("data: ") :])
+    assert envelope["type"] == event_line[len("event: ") :]
+    return envelope
+
+
+def test_format_sse_envelope() -> None:
+    """Test payloads are wrapped with their event type."""
+    message = format_sse("token", "ルート")
+
+    assert "ルート".encode() in message  # Non-ASCII is not escaped
+    assert _parse(message) == {"type": "token", "data": "ルート"}
+
+
+def test_format_sse_pre_encoded_bytes() -> None:
+    """Test bytes payloads are embedded as already-encoded JSON."""
+    message = format_sse("weather", b'[{"temperature":12.5}]')
+
+    assert _parse(message) == {"type": "weather", "data": [{"temperature": 12.5}]}
+
+
+def test_format_sse_tuples_and_nested() -> None:
+    """Test tuples and nested structures serialize like JSON arrays/objects."""
+    message = format_sse("route_data", {"coordinates": [(34.5, 135.4)], "total": 1})
+
+    assert _parse(message)["data"] == {"coordinates": [[34.5, 135.4]], "total": 1}
+
+
+def test_format_sse_models_match_model_dump_json() -> None:
+    """Test models and lists of models use pydantic's JSON serialization."""
+    forecast = WeatherForecast(
+        time=datetime(2025, 3, 15, 7, 0, tzinfo=UTC),
+        temperature=12.5,
+        wind_speed=4.0,
+        wind_direction=180.0,
+        precipitation_probability=10.0,
+        weather_code=0,
+        description="快晴",
+    )
+    expected = json.loads(forecast.model_dump_json())
+
+    assert _parse(format_sse("weather", forecast))["data"] == expected
+    assert _parse(format_sse("weather", [forecast, forecast]))["data"] == [expected, expected]
+    assert _parse(format_sse("route_data", {"forecasts": [forecast]}))["data"] == {
+        "forecasts": [expected]
+    }
+
+
+async def _aiter(items: list[str]) -> AsyncIterator[str]:
+    """Yield items as an async iterator.
+
+    Args:
+        items: Items to yield.
+
+    Yields:
+        Each item in order.
+    """
+    for item in items:
+        yield item
+
+
+async def test_batch_tokens_flushes_on_size() -> None:
+    """Test buffered text is flushed once it reaches max_chars."""
+    tokens = ["ab", "cd", "e"]
+
+    chunks = [
+        c async for c in batch_tokens(_aiter(tokens), max_chars=4, flush_interval_s=60)
+    ]
+
+    assert chunks == ["abcd", "e"]
+
+
+async def test_batch_tokens_flushes_on_ticker() -> None:
+    """Test buffered text is flushed by the ticker while the source stalls."""
+
+    async def slow_tokens() -> AsyncIterator[str]:
+        for token in ["a", "b"]:
+            yield token
+            await asyncio.sleep(0.05)
+
+    chunks = [
+        c async for c in batch_tokens(slow_tokens(), max_chars=4096, flush_interval_s=0.01)
+    ]
+
+    assert chunks == ["a", "b"]
+
+
+async def test_batch_tokens_propagates_errors() -> None:
+    """Test errors from the source stream reach the consumer."""
+
+    async def failing_tokens() -> AsyncIterator[str]:
+        yield "a"
+        raise RuntimeError("stream failed")
+
+    with pytest.raises(RuntimeError, match="stream failed"):
+        async for _ in batch_tokens(failing_tokens(), flush_interval_s=60):
+            pass
+
+
+async def test_stream_route_planning_sends_segments_individually() -> None:
+    """Test route data is split into per-segment events and an end marker."""
+    route_data = {
+        "segments": [{"distance_km": 10.0}, {"distance_km": 5.0}],
+        "total_distance_km": 15.0,
+    }
+
+    messages = [
+        _parse(m) async for m in stream_route_planning(route_data, [], _aiter(["分析"]))
+    ]
+
+    assert messages[:3] == [
+        {"type": "route_segment", "data": {"distance_km": 10.0}},
+        {"type": "route_segment", "data": {"distance_km": 5.0}},
+        {"type": "route_data_end", "data": {"segment_count": 2, "total_distance_km": 15.0}},
+    ]
+    assert [m["type"] for m in messages[3:]] == ["weather", "token", "done"]
@@ -89,8 +89,21 @@ export function usePlan(): UsePlanReturn {
               const event = JSON.parse(data);
 
               switch (event.type) {
-                case 'route_data':
-                  setRoutePlan(event.data);
+                case 'route_segment':
+                  // Segments arrive one per event; append as they stream in
+                  setRoutePlan((prev) => ({
+                    ...prev,
+                    segments: [...(prev?.segments || []), event.data],
+                  }));
+                  break;
+
+                case 'route_data_end':
+                  setRoutePlan((prev) => ({
+                    ...prev,
+                    total_distance_km: event.data.total_distance_km,
+                    total_elevation_gain_m: event.data.total_elevation_gain_m,
+                    total_duration_min: event.data.total_duration_min,
+                  }));
                   break;
 
                 case 'weather':
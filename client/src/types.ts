@@ -81,7 +81,13 @@ export interface GeocodeResponse {
 
 // SSE Event types
 export type SSEEvent =
-  | { type: 'route_data'; data: Omit<RoutePlan, 'weather_forecasts' | 'llm_analysis'> }
+  | { type: 'route_segment'; data: RouteSegment }
+  | {
+      type: 'route_data_end';
+      data: Pick<RoutePlan, 'total_distance_km' | 'total_elevation_gain_m' | 'total_duration_min'> & {
+        segment_count: number;
+      };
+    }
   | { type: 'weather'; data: WeatherForecast[] }
   | { type: 'token'; data: string }
   | { type: 'done' }
@@ -5,74 +5,203 @@ including time to first byte (TTFB) and total completion time.
 """
 
 import asyncio
-import json
+import socket
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import httpx
 import numpy as np
+import orjson
+
+try:
+    import aiohttp
+except ImportError:  # Optional: only needed for --client aiohttp
+    aiohttp = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop, not available on Windows
+    uvloop = None
 
 
 # Type aliases
 TestCase = dict[str, Any]
 BenchmarkResult = dict[str, Any]
+ClientKind = Literal["aiohttp", "httpx"]
+# httpx.AsyncClient or aiohttp.ClientSession
+HttpClient = Any
+
+# Request bodies are sent pre-encoded
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Concurrent connections kept open to the API
+CONNECTION_LIMIT = 100
+
+# Idle time before a pooled connection is dropped. Long enough that
+# connections (and their DNS lookup) are reused across test cases.
+KEEPALIVE_EXPIRY_S = 120.0
+
+# Disable Nagle so small request bodies aren't delayed, and keep idle pooled
+# connections alive between iterations
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
 
 
 class PerformanceMetrics:
-    """Container for performance measurement data."""
+    """Container for performance measurement data.
+
+    Latencies are written into preallocated float64 arrays, so statistics
+    run on them directly without converting from Python lists.
+    """
 
-    def __init__(self) -> None:
-        self.ttfb_times: list[float] = []
-        self.total_times: list[float] = []
+    def __init__(self, capacity: int) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            capacity: Maximum number of successful samples to record
+        """
+        self._ttfb = np.empty(capacity, dtype=np.float64)
+        self._total = np.empty(capacity, dtype=np.float64)
         self.successes: int = 0
         self.failures: int = 0
 
+    def record(self, ttfb: float, total: float) -> None:
+        """Record a successful request.
+
+        Args:
+            ttfb: Time to first byte in milliseconds
+            total: Total request time in milliseconds
+        """
+        self._ttfb[self.successes] = ttfb
+        self._total[self.successes] = total
+        self.successes += 1
+
+    @property
+    def ttfb_times(self) -> np.ndarray:
+        """TTFB samples recorded so far, in milliseconds."""
+        return self._ttfb[: self.successes]
+
+    @property
+    def total_times(self) -> np.ndarray:
+        """Total time samples recorded so far, in milliseconds."""
+        return self._total[: self.successes]
+
+
+def _build_payload(test_case: TestCase) -> bytes:
+    """Build the JSON-encoded /api/plan request body for a test case.
+
+    Args:
+        test_case: Test case to send
+
+    Returns:
+        Encoded request payload
+    """
+    return orjson.dumps(
+        {
+            "origin": test_case["origin"],
+            "destination": test_case["destination"],
+            "preferences": test_case["preferences"],
+            "departure_time": test_case["departure_time"],
+        }
+    )
+
 
 async def benchmark_single_request(
-    client: httpx.AsyncClient,
-    test_case: TestCase,
+    client: HttpClient,
+    payload: bytes,
     api_url: str,
 ) -> tuple[float | None, float | None, bool]:
     """Benchmark a single API request.
 
     Args:
-        client: HTTP client
-        test_case: Test case to send
+        client: HTTP client (httpx.AsyncClient or aiohttp.ClientSession)
+        payload: Encoded request body (see ``_build_payload``)
         api_url: API endpoint URL
 
     Returns:
         Tuple of (ttfb_ms, total_time_ms, success)
     """
-    # Build request payload
-    payload = {
-        "origin": test_case["origin"],
-        "destination": test_case["destination"],
-        "preferences": test_case["preferences"],
-        "departure_time": test_case["departure_time"],
-    }
+    if isinstance(client, httpx.AsyncClient):
+        return await _benchmark_single_request_httpx(client, payload, api_url)
+    return await _benchmark_single_request_aiohttp(client, payload, api_url)
+
+
+async def _benchmark_single_request_httpx(
+    client: httpx.AsyncClient,
+    payload: bytes,
+    api_url: str,
+) -> tuple[float | None, float | None, bool]:
+    """Benchmark a single API request using httpx.
+
+    Args:
+        client: HTTP client
+        payload: Encoded request body
+        api_url: API endpoint URL
 
-    start_time = time.perf_counter()
-    ttfb_time = None
-    first_byte_received = False
+    Returns:
+        Tuple of (ttfb_ms, total_time_ms, success)
+    """
+    start_ns = time.perf_counter_ns()
 
     try:
-        async with client.stream("POST", api_url, json=payload, timeout=120.0) as response:
+        async with client.stream(
+            "POST", api_url, content=payload, headers=JSON_HEADERS, timeout=120.0
+        ) as response:
             if response.status_code != 200:
                 return None, None, False
 
-            # Measure TTFB - time until first byte received
-            async for chunk in response.aiter_bytes():
-                if not first_byte_received:
-                    ttfb_time = (time.perf_counter() - start_time) * 1000
-                    first_byte_received = True
+            # TTFB - the response head has arrived; then drain the body in
+            # one call instead of iterating chunks in Python
+            ttfb_time = (time.perf_counter_ns() - start_ns) / 1e6
+            await response.aread()
+
+        total_time = (time.perf_counter_ns() - start_ns) / 1e6
+        return ttfb_time, total_time, True
+
+    except Exception as e:
+        print(f"    Error: {e}")
+        return None, None, False
+
+
+async def _benchmark_single_request_aiohttp(
+    session: "aiohttp.ClientSession",
+    payload: bytes,
+    api_url: str,
+) -> tuple[float | None, float | None, bool]:
+    """Benchmark a single API request using aiohttp.
+
+    Args:
+        session: aiohttp client session
+        payload: Encoded request body
+        api_url: API endpoint URL
+
+    Returns:
+        Tuple of (ttfb_ms, total_time_ms, success)
+    """
+    start_ns = time.perf_counter_ns()
 
-                # Continue consuming the stream
-                if len(chunk) > 0:
-                    pass
+    try:
+        async with session.post(
+            api_url,
+            data=payload,
+            headers=JSON_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=120),
+        ) as response:
+            if response.status != 200:
+                return None, None, False
 
-        total_time = (time.perf_counter() - start_time) * 1000
+            # TTFB - the response head has arrived; then drain the body in
+            # one call instead of iterating chunks in Python
+            ttfb_time = (time.perf_counter_ns() - start_ns) / 1e6
+            await response.read()
+
+        total_time = (time.perf_counter_ns() - start_ns) / 1e6
         return ttfb_time, total_time, True
 
     except Exception as e:
@@ -80,57 +209,132 @@ async def benchmark_single_request(
         return None, None, False
 
 
+@asynccontextmanager
+async def _open_client(kind: ClientKind) -> AsyncIterator[HttpClient]:
+    """Open the HTTP client used for the whole benchmark run.
+
+    Args:
+        kind: Client library to use
+
+    Yields:
+        httpx.AsyncClient or aiohttp.ClientSession
+
+    Raises:
+        RuntimeError: If aiohttp is requested but not installed
+    """
+    if kind == "httpx":
+        limits = httpx.Limits(
+            max_connections=CONNECTION_LIMIT,
+            max_keepalive_connections=CONNECTION_LIMIT,
+            keepalive_expiry=KEEPALIVE_EXPIRY_S,
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits, socket_options=SOCKET_OPTIONS)
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+        return
+
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed. Run: pip install aiohttp")
+    # aiohttp enables TCP_NODELAY and SO_KEEPALIVE on every connection itself
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT, ttl_dns_cache=300, keepalive_timeout=KEEPALIVE_EXPIRY_S
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+async def _health_status(client: HttpClient, health_url: str) -> int:
+    """Request the API health endpoint.
+
+    Args:
+        client: HTTP client (httpx.AsyncClient or aiohttp.ClientSession)
+        health_url: Health check URL
+
+    Returns:
+        HTTP status code
+    """
+    if isinstance(client, httpx.AsyncClient):
+        response = await client.get(health_url, timeout=5.0)
+        return response.status_code
+
+    async with client.get(health_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+        return response.status
+
+
+def _summarize_times(times: np.ndarray) -> dict[str, float | None]:
+    """Compute latency statistics in one pass over a numpy array.
+
+    Args:
+        times: Latency samples in milliseconds
+
+    Returns:
+        p50/p95/p99/min/max/mean, or all None if there are no samples
+    """
+    if times.size == 0:
+        return dict.fromkeys(("p50", "p95", "p99", "min", "max", "mean"))
+
+    # One call sorts once and returns all three quantiles
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "min": float(times.min()),
+        "max": float(times.max()),
+        "mean": float(times.mean()),
+    }
+
+
 async def benchmark_test_case(
+    client: HttpClient,
     test_case: TestCase,
     num_iterations: int = 10,
     api_url: str = "http://localhost:8000/api/plan",
+    concurrency: int = 1,
+    pacing_s: float = 0.0,
 ) -> BenchmarkResult:
     """Benchmark a test case multiple times.
 
     Args:
+        client: HTTP client (shared across test cases so connections are reused)
         test_case: Test case to benchmark
         num_iterations: Number of iterations to run
         api_url: API endpoint URL
+        concurrency: Maximum number of requests in flight at once
+        pacing_s: Delay after each request before its slot is reused
 
     Returns:
         Benchmark results with percentile statistics
     """
-    print(f"  Running {num_iterations} iterations...")
+    print(f"  Running {num_iterations} iterations (concurrency {concurrency})...")
 
-    metrics = PerformanceMetrics()
-
-    async with httpx.AsyncClient() as client:
-        for i in range(num_iterations):
-            ttfb, total, success = await benchmark_single_request(
-                client, test_case, api_url
-            )
+    metrics = PerformanceMetrics(num_iterations)
+    # Encode the request body once for all iterations
+    payload = _build_payload(test_case)
+    semaphore = asyncio.Semaphore(concurrency)
 
+    async def run_iteration(i: int) -> tuple[float | None, float | None, bool]:
+        async with semaphore:
+            ttfb, total, success = await benchmark_single_request(client, payload, api_url)
             if success and ttfb is not None and total is not None:
-                metrics.ttfb_times.append(ttfb)
-                metrics.total_times.append(total)
-                metrics.successes += 1
                 print(f"    [{i+1}/{num_iterations}] TTFB: {ttfb:.0f}ms, Total: {total:.0f}ms")
             else:
-                metrics.failures += 1
                 print(f"    [{i+1}/{num_iterations}] FAILED")
 
-            # Small delay between requests
-            await asyncio.sleep(0.5)
+            if pacing_s > 0:
+                await asyncio.sleep(pacing_s)
+            return ttfb, total, success
 
-    # Calculate percentiles
-    if metrics.ttfb_times:
-        ttfb_p50 = float(np.percentile(metrics.ttfb_times, 50))
-        ttfb_p95 = float(np.percentile(metrics.ttfb_times, 95))
-        ttfb_p99 = float(np.percentile(metrics.ttfb_times, 99))
-    else:
-        ttfb_p50 = ttfb_p95 = ttfb_p99 = None
+    results = await asyncio.gather(*(run_iteration(i) for i in range(num_iterations)))
 
-    if metrics.total_times:
-        total_p50 = float(np.percentile(metrics.total_times, 50))
-        total_p95 = float(np.percentile(metrics.total_times, 95))
-        total_p99 = float(np.percentile(metrics.total_times, 99))
-    else:
-        total_p50 = total_p95 = total_p99 = None
+    for ttfb, total, success in results:
+        if success and ttfb is not None and total is not None:
+            metrics.record(ttfb, total)
+        else:
+            metrics.failures += 1
+
+    ttfb_stats = _summarize_times(metrics.ttfb_times)
+    total_stats = _summarize_times(metrics.total_times)
 
     success_rate = metrics.successes / num_iterations if num_iterations > 0 else 0.0
 
@@ -140,73 +344,42 @@ async def benchmark_test_case(
         "successes": metrics.successes,
         "failures": metrics.failures,
         "success_rate": success_rate,
-        "ttfb_ms": {
-            "p50": ttfb_p50,
-            "p95": ttfb_p95,
-            "p99": ttfb_p99,
-            "min": float(min(metrics.ttfb_times)) if metrics.ttfb_times else None,
-            "max": float(max(metrics.ttfb_times)) if metrics.ttfb_times else None,
-            "mean": float(np.mean(metrics.ttfb_times)) if metrics.ttfb_times else None,
-        },
-        "total_time_ms": {
-            "p50": total_p50,
-            "p95": total_p95,
-            "p99": total_p99,
-            "min": float(min(metrics.total_times)) if metrics.total_times else None,
-            "max": float(max(metrics.total_times)) if metrics.total_times else None,
-            "mean": float(np.mean(metrics.total_times)) if metrics.total_times else None,
-        },
+        "ttfb_ms": ttfb_stats,
+        "total_time_ms": total_stats,
         "benchmarked_at": datetime.now().isoformat(),
     }
 
 
-async def run_benchmark(
-    num_iterations: int = 10,
-    api_url: str = "http://localhost:8000/api/plan",
-) -> None:
-    """Run benchmark on all test cases and save results.
+async def _benchmark_all(
+    client: HttpClient,
+    test_cases: list[TestCase],
+    num_iterations: int,
+    api_url: str,
+    concurrency: int,
+    pacing_s: float,
+) -> list[BenchmarkResult]:
+    """Benchmark each test case in turn.
 
     Args:
+        client: HTTP client
+        test_cases: Test cases to benchmark
         num_iterations: Number of iterations per test case
         api_url: API endpoint URL
-    """
-    print("=== Cycling Route API Performance Benchmark ===\n")
-    print(f"Target API: {api_url}")
-    print(f"Iterations per test case: {num_iterations}\n")
-
-    # Load test cases
-    eval_dir = Path(__file__).parent
-    test_routes_path = eval_dir / "test_routes.json"
-
-    with open(test_routes_path, "r", encoding="utf-8") as f:
-        test_cases = json.load(f)
-
-    print(f"Loaded {len(test_cases)} test cases\n")
-
-    # Check if API is available
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                api_url.replace("/api/plan", "/health"), timeout=5.0
-            )
-            if response.status_code != 200:
-                print(f"WARNING: API health check failed (status {response.status_code})")
-                print("Continuing anyway...\n")
-    except Exception as e:
-        print(f"WARNING: Cannot reach API at {api_url}")
-        print(f"Error: {e}")
-        print("\nThis benchmark requires a running backend server.")
-        print("Start the server with: make dev\n")
-        return
+        concurrency: Maximum number of requests in flight per test case
+        pacing_s: Delay after each request before its slot is reused
 
-    # Benchmark each test case
+    Returns:
+        Benchmark result (or error record) per test case
+    """
     all_results = []
 
     for i, test_case in enumerate(test_cases, 1):
         print(f"[{i}/{len(test_cases)}] Benchmarking: {test_case['name']}")
 
         try:
-            result = await benchmark_test_case(test_case, num_iterations, api_url)
+            result = await benchmark_test_case(
+                client, test_case, num_iterations, api_url, concurrency, pacing_s
+            )
             all_results.append(result)
 
             # Print summary for this test case
@@ -234,24 +407,81 @@ async def run_benchmark(
                 }
             )
 
+    return all_results
+
+
+async def run_benchmark(
+    num_iterations: int = 10,
+    api_url: str = "http://localhost:8000/api/plan",
+    client_kind: ClientKind = "aiohttp",
+    concurrency: int = 1,
+    pacing_s: float = 0.0,
+) -> None:
+    """Run benchmark on all test cases and save results.
+
+    Args:
+        num_iterations: Number of iterations per test case
+        api_url: API endpoint URL
+        client_kind: HTTP client library used to drive the benchmark
+        concurrency: Maximum number of requests in flight per test case
+        pacing_s: Delay after each request before its slot is reused
+    """
+    # Formatted once; the run is stamped with its start time
+    benchmarked_at = datetime.now().isoformat()
+
+    print("=== Cycling Route API Performance Benchmark ===\n")
+    print(f"Target API: {api_url}")
+    print(f"HTTP client: {client_kind}")
+    print(f"Iterations per test case: {num_iterations}")
+    print(f"Concurrency: {concurrency}\n")
+
+    # Load test cases
+    eval_dir = Path(__file__).parent
+    test_routes_path = eval_dir / "test_routes.json"
+
+    test_cases = orjson.loads(test_routes_path.read_bytes())
+
+    print(f"Loaded {len(test_cases)} test cases\n")
+
+    # One client for the health check and all test cases, so the
+    # connection to the API is reused
+    async with _open_client(client_kind) as client:
+        # Check if API is available
+        try:
+            status = await _health_status(client, api_url.replace("/api/plan", "/health"))
+            if status != 200:
+                print(f"WARNING: API health check failed (status {status})")
+                print("Continuing anyway...\n")
+        except Exception as e:
+            print(f"WARNING: Cannot reach API at {api_url}")
+            print(f"Error: {e}")
+            print("\nThis benchmark requires a running backend server.")
+            print("Start the server with: make dev\n")
+            return
+
+        all_results = await _benchmark_all(
+            client, test_cases, num_iterations, api_url, concurrency, pacing_s
+        )
+
     # Save results
     results_dir = eval_dir / "results"
     results_dir.mkdir(exist_ok=True)
     results_path = results_dir / "benchmark_results.json"
 
-    with open(results_path, "w", encoding="utf-8") as f:
-        json.dump(
+    results_path.write_bytes(
+        orjson.dumps(
             {
-                "benchmarked_at": datetime.now().isoformat(),
+                "benchmarked_at": benchmarked_at,
                 "api_url": api_url,
                 "num_iterations": num_iterations,
+                "client": client_kind,
+                "concurrency": concurrency,
                 "total_cases": len(test_cases),
                 "results": all_results,
             },
-            f,
-            ensure_ascii=False,
-            indent=2,
+            option=orjson.OPT_INDENT_2,
         )
+    )
 
     print(f"\n=== Benchmark Complete ===")
     print(f"Results saved to: {results_path}")
@@ -302,6 +532,36 @@ if __name__ == "__main__":
         help="API endpoint URL (default: http://localhost:8000/api/plan)",
     )
 
+    parser.add_argument(
+        "--client",
+        choices=["aiohttp", "httpx"],
+        default="aiohttp",
+        help="HTTP client library used to send requests (default: aiohttp)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum concurrent requests per test case (default: 1)",
+    )
+    parser.add_argument(
+        "--pacing",
+        type=float,
+        default=0.0,
+        help="Seconds to wait after each request before sending the next (default: 0)",
+    )
+
     args = parser.parse_args()
 
-    asyncio.run(run_benchmark(args.iterations, args.api_url))
+    # Run on uvloop when installed so event loop overhead stays out of the timings
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(
+        run_benchmark(
+            args.iterations,
+            args.api_url,
+            args.client,
+            max(1, args.concurrency),
+            args.pacing,
+        )
+    )
@@ -1,7 +1,17 @@
 """Elevation profile calculation for cycling routes."""
 
+import asyncio
+from collections import OrderedDict
+from operator import sub
+from typing import cast
+
 import httpx
 
+from planner.http import get_http_client
+
+# Coordinate precision sent to the elevation API
+COORD_FORMAT = "{:.6f}"
+
 
 class ElevationAPIError(Exception):
     """Raised when elevation API request fails."""
@@ -14,6 +24,25 @@ class ElevationService:
 
     BASE_URL = "https://api.open-meteo.com/v1/elevation"
 
+    # OpenMeteo elevation API accepts up to 100 points per request
+    MAX_POINTS_PER_REQUEST = 100
+
+    # Maximum concurrent batch requests per profile; longer routes are sampled
+    MAX_PARALLEL_REQUESTS = 10
+
+    # Maximum number of cached elevation points
+    CACHE_SIZE = 50_000
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize the elevation service.
+
+        Args:
+            client: HTTP client to use. If None, the shared planner client is used.
+        """
+        self._client = client
+        # LRU cache of API elevations keyed by coordinates quantized to 1e-5° (~1 m)
+        self._cache: OrderedDict[tuple[int, int], float] = OrderedDict()
+
     async def get_elevation_profile(
         self, coordinates: list[tuple[float, float]]
     ) -> list[float]:
@@ -31,9 +60,9 @@ class ElevationService:
         if not coordinates:
             return []
 
-        # OpenMeteo elevation API accepts up to 100 points per request
-        # For longer routes, we'll sample evenly
-        max_points = 100
+        # Routes are fetched at full resolution in concurrent batches of 100
+        # points. Only routes beyond MAX_PARALLEL_REQUESTS batches are sampled.
+        max_points = self.MAX_POINTS_PER_REQUEST * self.MAX_PARALLEL_REQUESTS
         sampled_coords = self._sample_coordinates(coordinates, max_points)
 
         elevations = await self._fetch_elevations(sampled_coords)
@@ -46,7 +75,7 @@ class ElevationService:
 
         return elevations
 
-    async def calculate_elevation_stats(
+    def calculate_elevation_stats(
         self, elevations: list[float]
     ) -> tuple[float, float]:
         """Calculate total elevation gain and loss.
@@ -60,15 +89,15 @@ class ElevationService:
         if len(elevations) < 2:
             return 0.0, 0.0
 
+        # Sum rises and drops directly in one pass over the steps. Deriving the
+        # loss from gain minus net change accumulates float error.
         total_gain = 0.0
         total_loss = 0.0
-
-        for i in range(1, len(elevations)):
-            diff = elevations[i] - elevations[i - 1]
+        for diff in map(sub, elevations[1:], elevations):
             if diff > 0:
                 total_gain += diff
             else:
-                total_loss += abs(diff)
+                total_loss -= diff
 
         return total_gain, total_loss
 
@@ -87,18 +116,22 @@ class ElevationService:
         if len(coordinates) <= max_points:
             return coordinates
 
-        # Always include first and last points
+        # Always include first and last points; index directly, without
+        # building an intermediate index list
         step = (len(coordinates) - 1) / (max_points - 1)
-        indices = [int(i * step) for i in range(max_points - 1)]
-        indices.append(len(coordinates) - 1)
+        sampled = [coordinates[int(i * step)] for i in range(max_points - 1)]
+        sampled.append(coordinates[-1])
 
-        return [coordinates[i] for i in indices]
+        return sampled
 
     async def _fetch_elevations(
         self, coordinates: list[tuple[float, float]]
     ) -> list[float]:
         """Fetch elevations from OpenMeteo API.
 
+        Points already in the cache are not requested again. The rest are
+        split into batches of ``MAX_POINTS_PER_REQUEST`` fetched concurrently.
+
         Args:
             coordinates: List of (lat, lng) tuples.
 
@@ -108,32 +141,92 @@ class ElevationService:
         Raises:
             ElevationAPIError: If API request fails.
         """
-        # OpenMeteo elevation API expects comma-separated lat,lng pairs
-        lats = [str(coord[0]) for coord in coordinates]
-        lngs = [str(coord[1]) for coord in coordinates]
+        cache = self._cache
+        keys = [(round(lat * 1e5), round(lng * 1e5)) for lat, lng in coordinates]
+        elevations: list[float | None] = []
+        for key in keys:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            elevations.append(value)
+
+        misses = [i for i, value in enumerate(elevations) if value is None]
+        if not misses:
+            # Every point was a cache hit, so no None entries remain
+            return cast(list[float], elevations)
+
+        # Batches are independent requests, so issue them concurrently
+        missing = [coordinates[i] for i in misses]
+        size = self.MAX_POINTS_PER_REQUEST
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+
+        # return_exceptions keeps a failed batch from abandoning its siblings
+        # mid-request; every batch has finished before any fallback starts
+        results = await asyncio.gather(
+            *(self._request_elevations(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        fetched: list[float] = []
+        for result in results:
+            if isinstance(result, httpx.HTTPError):
+                # HTTP error status or network error - try fallback
+                return await self._fallback_elevation_fetch(coordinates)
+            if isinstance(result, BaseException):
+                raise result
+            fetched.extend(result)
+
+        for i, value in zip(misses, fetched, strict=True):
+            elevations[i] = value
+            cache[keys[i]] = value
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+        # Every miss has been filled in, so no None entries remain
+        return cast(list[float], elevations)
+
+    async def _request_elevations(
+        self, coordinates: list[tuple[float, float]]
+    ) -> list[float]:
+        """Request elevations for a single batch from OpenMeteo API.
+
+        Args:
+            coordinates: List of (lat, lng) tuples, at most
+                ``MAX_POINTS_PER_REQUEST`` long.
+
+        Returns:
+            List of elevations in meters.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status.
+            httpx.RequestError: If the request fails.
+            ElevationAPIError: If the response contains no elevation data or
+                a different number of values than coordinates.
+        """
+        # OpenMeteo elevation API expects comma-separated lat,lng pairs.
+        # Six decimals (~0.1 m) is plenty and caps the query string length.
+        lats, lngs = zip(*coordinates, strict=True)
 
         params = {
-            "latitude": ",".join(lats),
-            "longitude": ",".join(lngs),
+            "latitude": ",".join(map(COORD_FORMAT.format, lats)),
+            "longitude": ",".join(map(COORD_FORMAT.format, lngs)),
         }
 
-        try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-        except httpx.HTTPStatusError as e:
-            # Fallback: try using OpenRouteService elevation API if available
-            return await self._fallback_elevation_fetch(coordinates)
-        except httpx.RequestError as e:
-            # Network error - try fallback
-            return await self._fallback_elevation_fetch(coordinates)
+        client = self._client or get_http_client()
+        response = await client.get(self.BASE_URL, params=params, timeout=15.0)
+        response.raise_for_status()
+        data = response.json()
 
         # Parse elevation data
         elevations = data.get("elevation", [])
         if not elevations:
             raise ElevationAPIError("No elevation data in API response")
+        if len(elevations) != len(coordinates):
+            # A short batch would shift every later value onto the wrong point
+            raise ElevationAPIError(
+                f"Elevation API returned {len(elevations)} values "
+                f"for {len(coordinates)} points"
+            )
 
         return elevations
 
@@ -178,31 +271,22 @@ class ElevationService:
         if original_count >= target_count or target_count == 1:
             return elevations[:target_count]
 
-        if len(elevations) != original_count:
-            # Safety check: ensure elevations list matches original_count
-            elevations = elevations[:original_count] if len(elevations) > original_count else elevations
+        # Only the first original_count values correspond to sampled points
+        elevations = elevations[:original_count]
+        last = len(elevations) - 1
+        if last <= 0:
+            return [elevations[0]] * target_count if elevations else []
 
+        # Linear interpolation: target i maps to source position i * scale
+        scale = (original_count - 1) / (target_count - 1)
         interpolated = []
         for i in range(target_count):
-            # Map target index to source index
-            if target_count == 1:
-                source_idx = 0.0
-            else:
-                source_idx = (i / (target_count - 1)) * (original_count - 1)
-
-            lower_idx = int(source_idx)
-            upper_idx = min(lower_idx + 1, len(elevations) - 1)
-
-            # Linear interpolation
-            if lower_idx >= len(elevations):
-                interpolated.append(elevations[-1])
-            elif lower_idx == upper_idx or upper_idx >= len(elevations):
-                interpolated.append(elevations[lower_idx])
-            else:
-                fraction = source_idx - lower_idx
-                value = elevations[lower_idx] * (1 - fraction) + elevations[
-                    upper_idx
-                ] * fraction
-                interpolated.append(value)
+            pos = i * scale
+            lower_idx = int(pos)
+            if lower_idx >= last:
+                interpolated.append(elevations[last])
+                continue
+            lower = elevations[lower_idx]
+            interpolated.append(lower + (elevations[lower_idx + 1] - lower) * (pos - lower_idx))
 
         return interpolated
@@ -2,6 +2,7 @@
 
 import os
 import httpx
+from planner.http import get_http_client
 from planner.schemas import Location
 
 
@@ -16,11 +17,12 @@ class Geocoder:
 
     BASE_URL = "https://api.openrouteservice.org/geocode/search"
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, client: httpx.AsyncClient | None = None):
         """Initialize the geocoder.
 
         Args:
             api_key: OpenRouteService API key. If None, reads from ORS_API_KEY env var.
+            client: HTTP client to use. If None, the shared planner client is used.
 
         Raises:
             ValueError: If API key is not provided and not in environment.
@@ -30,6 +32,7 @@ class Geocoder:
             raise ValueError(
                 "OpenRouteService API key required. Set ORS_API_KEY environment variable."
             )
+        self._client = client
 
     async def geocode(self, query: str, country: str = "JP") -> list[Location]:
         """Geocode an address or place name.
@@ -59,14 +62,15 @@ class Geocoder:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.BASE_URL,
-                    params=params,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = self._client or get_http_client()
+            response = await client.get(
+                self.BASE_URL,
+                params=params,
+                headers=headers,
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            data = response.json()
 
         except httpx.HTTPStatusError as e:
             raise GeocodingError(
@@ -0,0 +1,37 @@
+"""Shared HTTP client for external API calls.
+
+Services fall back to this client when none is injected, so connections
+to the same host are pooled and reused across calls instead of paying a
+new TCP/TLS handshake per request.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient with a keep-alive connection pool.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,8 +1,121 @@
 """Risk assessment and gear recommendations for cycling routes."""
 
+from dataclasses import dataclass
+from operator import attrgetter
+
 from planner.schemas import RouteSegment, WeatherForecast, RoutePreferences
 
 
+# Surface types counted as unpaved
+UNPAVED_SURFACES = frozenset({"gravel", "dirt"})
+
+# Multi-field getters: one C-level call per item in the aggregation loops
+_WEATHER_FIELDS = attrgetter(
+    "wind_speed", "precipitation_probability", "temperature", "weather_code"
+)
+_SEGMENT_FIELDS = attrgetter(
+    "elevation_gain_m", "distance_km", "estimated_duration_min", "surface_type"
+)
+
+
+@dataclass(slots=True)
+class WeatherStats:
+    """Aggregate weather statistics over a list of forecasts."""
+
+    max_wind: float
+    max_precip: float
+    min_temp: float
+    max_temp: float
+    has_severe: bool
+
+
+@dataclass(slots=True)
+class RouteStats:
+    """Aggregate totals over a list of route segments."""
+
+    total_elevation_gain_m: float
+    total_distance_km: float
+    total_duration_min: int
+    unpaved_km: float
+    # Steepest segment by gain/distance (fraction, not %); index is -1 if none
+    max_gradient: float
+    max_gradient_idx: int
+
+
+def compute_weather_stats(forecasts: list[WeatherForecast]) -> WeatherStats | None:
+    """Compute weather statistics in a single pass.
+
+    Args:
+        forecasts: Weather forecasts.
+
+    Returns:
+        Weather statistics, or None if there are no forecasts.
+    """
+    if not forecasts:
+        return None
+
+    rows = map(_WEATHER_FIELDS, forecasts)
+    max_wind, max_precip, min_temp, code = next(rows)
+    max_temp = min_temp
+    has_severe = code >= 95
+    for wind, precip, temp, code in rows:
+        if wind > max_wind:
+            max_wind = wind
+        if precip > max_precip:
+            max_precip = precip
+        if temp < min_temp:
+            min_temp = temp
+        elif temp > max_temp:
+            max_temp = temp
+        if code >= 95:
+            has_severe = True
+
+    return WeatherStats(
+        max_wind=max_wind,
+        max_precip=max_precip,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        has_severe=has_severe,
+    )
+
+
+def compute_route_stats(segments: list[RouteSegment]) -> RouteStats:
+    """Compute route totals, unpaved distance and steepest gradient in a single pass.
+
+    Args:
+        segments: Route segments.
+
+    Returns:
+        Route statistics.
+    """
+    total_elevation = 0.0
+    total_distance = 0.0
+    total_duration = 0
+    unpaved_km = 0.0
+    max_gradient = 0.0
+    max_gradient_idx = -1
+    for i, (gain, distance, duration, surface) in enumerate(map(_SEGMENT_FIELDS, segments)):
+        total_elevation += gain
+        total_distance += distance
+        total_duration += duration
+        if surface in UNPAVED_SURFACES:
+            unpaved_km += distance
+        if distance > 0:
+            gradient = gain / (distance * 1000)
+            if max_gradient_idx < 0 or gradient > max_gradient:
+                max_gradient = gradient
+                max_gradient_idx = i
+
+    return RouteStats(
+        total_elevation_gain_m=total_elevation,
+        total_distance_km=total_distance,
+        total_duration_min=total_duration,
+        unpaved_km=unpaved_km,
+        max_gradient=max_gradient,
+        max_gradient_idx=max_gradient_idx,
+    )
+
+
 class RiskAssessor:
     """Assesses route risks and recommends appropriate gear."""
 
@@ -22,6 +135,8 @@ class RiskAssessor:
         segments: list[RouteSegment],
         weather_forecasts: list[WeatherForecast],
         preferences: RoutePreferences,
+        weather_stats: WeatherStats | None = None,
+        route_stats: RouteStats | None = None,
     ) -> tuple[list[str], list[str]]:
         """Assess route risks and generate warnings and gear recommendations.
 
@@ -29,6 +144,9 @@ class RiskAssessor:
             segments: Route segments.
             weather_forecasts: Weather forecasts along the route.
             preferences: User preferences.
+            weather_stats: Precomputed statistics for ``weather_forecasts``, so
+                callers that also run ``calculate_risk_score`` aggregate only once.
+            route_stats: Precomputed statistics for ``segments``.
 
         Returns:
             Tuple of (warnings, recommended_gear).
@@ -42,35 +160,46 @@ class RiskAssessor:
         gear.add("Repair kit (spare tube, tire levers, pump)")
         gear.add("Bike lights (front and rear)")
 
+        # Aggregate once; every assessment below reads from these
+        if weather_stats is None:
+            weather_stats = compute_weather_stats(weather_forecasts)
+        if route_stats is None:
+            route_stats = compute_route_stats(segments)
+
         # Assess weather risks
-        weather_warnings, weather_gear = self._assess_weather(weather_forecasts)
+        weather_warnings, weather_gear = self._assess_weather(
+            weather_forecasts, stats=weather_stats
+        )
         warnings.extend(weather_warnings)
         gear.update(weather_gear)
 
         # Assess elevation risks
-        elevation_warnings, elevation_gear = self._assess_elevation(segments, preferences)
+        elevation_warnings, elevation_gear = self._assess_elevation(
+            segments, preferences, stats=route_stats
+        )
         warnings.extend(elevation_warnings)
         gear.update(elevation_gear)
 
         # Assess distance risks
-        distance_warnings, distance_gear = self._assess_distance(segments)
+        distance_warnings, distance_gear = self._assess_distance(segments, stats=route_stats)
         warnings.extend(distance_warnings)
         gear.update(distance_gear)
 
         # Assess surface type risks
-        surface_warnings, surface_gear = self._assess_surface(segments)
+        surface_warnings, surface_gear = self._assess_surface(segments, stats=route_stats)
         warnings.extend(surface_warnings)
         gear.update(surface_gear)
 
-        return warnings, sorted(list(gear))
+        return warnings, sorted(gear)
 
     def _assess_weather(
-        self, forecasts: list[WeatherForecast]
+        self, forecasts: list[WeatherForecast], stats: WeatherStats | None = None
     ) -> tuple[list[str], list[str]]:
         """Assess weather-related risks.
 
         Args:
             forecasts: Weather forecasts.
+            stats: Precomputed statistics for ``forecasts``, if available.
 
         Returns:
             Tuple of (warnings, gear).
@@ -78,16 +207,15 @@ class RiskAssessor:
         warnings = []
         gear = []
 
-        if not forecasts:
+        if stats is None:
+            stats = compute_weather_stats(forecasts)
+        if stats is None:
             return warnings, gear
 
-        # Calculate weather statistics
-        max_wind = max(f.wind_speed for f in forecasts)
-        avg_wind = sum(f.wind_speed for f in forecasts) / len(forecasts)
-        max_precip = max(f.precipitation_probability for f in forecasts)
-        avg_temp = sum(f.temperature for f in forecasts) / len(forecasts)
-        min_temp = min(f.temperature for f in forecasts)
-        max_temp = max(f.temperature for f in forecasts)
+        max_wind = stats.max_wind
+        max_precip = stats.max_precip
+        min_temp = stats.min_temp
+        max_temp = stats.max_temp
 
         # Wind warnings
         if max_wind >= self.VERY_HIGH_WIND_THRESHOLD:
@@ -143,8 +271,7 @@ class RiskAssessor:
             gear.append("Lightweight, breathable clothing")
 
         # Check for severe weather codes
-        severe_weather = [f for f in forecasts if f.weather_code >= 95]
-        if severe_weather:
+        if stats.has_severe:
             warnings.append(
                 "⚠️ SEVERE: Thunderstorms possible. Avoid riding during storms."
             )
@@ -152,13 +279,17 @@ class RiskAssessor:
         return warnings, gear
 
     def _assess_elevation(
-        self, segments: list[RouteSegment], preferences: RoutePreferences
+        self,
+        segments: list[RouteSegment],
+        preferences: RoutePreferences,
+        stats: RouteStats | None = None,
     ) -> tuple[list[str], list[str]]:
         """Assess elevation-related risks.
 
         Args:
             segments: Route segments.
             preferences: User preferences.
+            stats: Precomputed statistics for ``segments``, if available.
 
         Returns:
             Tuple of (warnings, gear).
@@ -166,7 +297,9 @@ class RiskAssessor:
         warnings = []
         gear = []
 
-        total_elevation_gain = sum(seg.elevation_gain_m for seg in segments)
+        if stats is None:
+            stats = compute_route_stats(segments)
+        total_elevation_gain = stats.total_elevation_gain_m
 
         # Check against user's max elevation preference
         if preferences.max_elevation_gain_m:
@@ -199,32 +332,24 @@ class RiskAssessor:
             )
             gear.append("Energy bars or snacks")
 
-        # Check for steep segments
-        steep_segments = [
-            (i, seg)
-            for i, seg in enumerate(segments)
-            if seg.distance_km > 0 and (seg.elevation_gain_m / (seg.distance_km * 1000)) > 0.08
-        ]
-
-        if steep_segments:
-            steepest = max(
-                steep_segments,
-                key=lambda x: x[1].elevation_gain_m / (x[1].distance_km * 1000),
-            )
-            idx, seg = steepest
-            gradient = (seg.elevation_gain_m / (seg.distance_km * 1000)) * 100
+        # Check for steep segments (steepest one found while aggregating)
+        if stats.max_gradient > 0.08:
+            gradient = stats.max_gradient * 100
             warnings.append(
-                f"⚠️ Steep climb in segment {idx + 1}: {gradient:.1f}% gradient. "
+                f"⚠️ Steep climb in segment {stats.max_gradient_idx + 1}: {gradient:.1f}% gradient. "
                 "Consider lower gearing."
             )
 
         return warnings, gear
 
-    def _assess_distance(self, segments: list[RouteSegment]) -> tuple[list[str], list[str]]:
+    def _assess_distance(
+        self, segments: list[RouteSegment], stats: RouteStats | None = None
+    ) -> tuple[list[str], list[str]]:
         """Assess distance-related risks.
 
         Args:
             segments: Route segments.
+            stats: Precomputed statistics for ``segments``, if available.
 
         Returns:
             Tuple of (warnings, gear).
@@ -232,7 +357,9 @@ class RiskAssessor:
         warnings = []
         gear = []
 
-        total_distance = sum(seg.distance_km for seg in segments)
+        if stats is None:
+            stats = compute_route_stats(segments)
+        total_distance = stats.total_distance_km
 
         if total_distance >= self.LONG_DISTANCE_THRESHOLD:
             warnings.append(
@@ -245,18 +372,20 @@ class RiskAssessor:
             gear.append("Portable phone charger")
 
         # Recommend based on duration
-        total_duration = sum(seg.estimated_duration_min for seg in segments)
-        if total_duration > 180:  # More than 3 hours
+        if stats.total_duration_min > 180:  # More than 3 hours
             gear.append("Chamois cream (for comfort)")
             gear.append("Arm warmers (temperature changes)")
 
         return warnings, gear
 
-    def _assess_surface(self, segments: list[RouteSegment]) -> tuple[list[str], list[str]]:
+    def _assess_surface(
+        self, segments: list[RouteSegment], stats: RouteStats | None = None
+    ) -> tuple[list[str], list[str]]:
         """Assess surface type risks.
 
         Args:
             segments: Route segments.
+            stats: Precomputed statistics for ``segments``, if available.
 
         Returns:
             Tuple of (warnings, gear).
@@ -264,19 +393,13 @@ class RiskAssessor:
         warnings = []
         gear = []
 
-        # Calculate surface distribution
-        surface_km = {}
-        for seg in segments:
-            surface_km[seg.surface_type] = (
-                surface_km.get(seg.surface_type, 0) + seg.distance_km
-            )
-
-        total_distance = sum(surface_km.values())
+        # Unpaved share of the route
+        if stats is None:
+            stats = compute_route_stats(segments)
+        unpaved_km = stats.unpaved_km
+        total_distance = stats.total_distance_km
 
         # Check for unpaved surfaces
-        gravel_km = surface_km.get("gravel", 0)
-        dirt_km = surface_km.get("dirt", 0)
-        unpaved_km = gravel_km + dirt_km
 
         if unpaved_km > 0:
             unpaved_pct = (unpaved_km / total_distance) * 100
@@ -300,24 +423,34 @@ class RiskAssessor:
         self,
         segments: list[RouteSegment],
         weather_forecasts: list[WeatherForecast],
+        weather_stats: WeatherStats | None = None,
+        route_stats: RouteStats | None = None,
     ) -> float:
         """Calculate overall risk score (0-100, higher = more risky).
 
         Args:
             segments: Route segments.
             weather_forecasts: Weather forecasts.
+            weather_stats: Precomputed statistics for ``weather_forecasts``, so
+                callers that also run ``assess_route`` aggregate only once.
+            route_stats: Precomputed statistics for ``segments``.
 
         Returns:
             Risk score between 0 and 100.
         """
         risk_score = 0.0
 
+        if weather_stats is None:
+            weather_stats = compute_weather_stats(weather_forecasts)
+        if route_stats is None:
+            route_stats = compute_route_stats(segments)
+
         # Weather risk (0-40 points)
-        if weather_forecasts:
-            max_wind = max(f.wind_speed for f in weather_forecasts)
-            max_precip = max(f.precipitation_probability for f in weather_forecasts)
-            max_temp = max(f.temperature for f in weather_forecasts)
-            min_temp = min(f.temperature for f in weather_forecasts)
+        if weather_stats is not None:
+            max_wind = weather_stats.max_wind
+            max_precip = weather_stats.max_precip
+            max_temp = weather_stats.max_temp
+            min_temp = weather_stats.min_temp
 
             # Wind risk (0-15)
             risk_score += min(15, max_wind / self.VERY_HIGH_WIND_THRESHOLD * 15)
@@ -331,20 +464,18 @@ class RiskAssessor:
             if max_temp > self.HOT_TEMP_THRESHOLD:
                 risk_score += min(10, (max_temp - self.HOT_TEMP_THRESHOLD) / 10 * 10)
 
+        total_elevation = route_stats.total_elevation_gain_m
+        total_distance = route_stats.total_distance_km
+        unpaved_km = route_stats.unpaved_km
+
         # Elevation risk (0-30 points)
-        total_elevation = sum(seg.elevation_gain_m for seg in segments)
         risk_score += min(30, total_elevation / self.HARD_ELEVATION_THRESHOLD * 30)
 
         # Distance risk (0-20 points)
-        total_distance = sum(seg.distance_km for seg in segments)
         risk_score += min(20, total_distance / 150 * 20)
 
         # Surface risk (0-10 points)
-        unpaved_km = sum(
-            seg.distance_km for seg in segments if seg.surface_type in ["gravel", "dirt"]
-        )
-        total_km = sum(seg.distance_km for seg in segments)
-        if total_km > 0:
-            risk_score += (unpaved_km / total_km) * 10
+        if total_distance > 0:
+            risk_score += (unpaved_km / total_distance) * 10
 
         return min(100.0, risk_score)
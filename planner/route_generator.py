@@ -1,16 +1,28 @@
 """Route generation using OpenRouteService API."""
 
+import asyncio
 import logging
-import math
 import os
+from math import cos, radians
 from typing import Literal
 
 import httpx
+from pydantic_core import from_json
 
+from planner.http import get_http_client
 from planner.schemas import Location, RoutePreferences, RouteSegment
 
 logger = logging.getLogger(__name__)
 
+# ORS cycling profiles
+CyclingProfile = Literal["cycling-regular", "cycling-road", "cycling-mountain"]
+
+# 1 degree latitude ≈ 111,000 meters
+METERS_PER_DEGREE_LAT = 111000.0
+
+# ORS surface codes we map directly: 1=Paved, 2=Unpaved, 3=Asphalt
+_SURFACE_BY_CODE: dict[int, str] = {1: "paved", 2: "gravel", 3: "paved"}
+
 
 class RouteGenerationError(Exception):
     """Raised when route generation fails."""
@@ -23,11 +35,12 @@ class RouteGenerator:
 
     BASE_URL = "https://api.openrouteservice.org/v2/directions"
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, client: httpx.AsyncClient | None = None):
         """Initialize the route generator.
 
         Args:
             api_key: OpenRouteService API key. If None, reads from ORS_API_KEY env var.
+            client: HTTP client to use. If None, the shared planner client is used.
 
         Raises:
             ValueError: If API key is not provided and not in environment.
@@ -37,13 +50,18 @@ class RouteGenerator:
             raise ValueError(
                 "OpenRouteService API key required. Set ORS_API_KEY environment variable."
             )
+        self._client = client
+        self._headers = {
+            "Authorization": self.api_key,
+            "Content-Type": "application/json",
+        }
 
     async def generate_route(
         self,
         origin: Location,
         destination: Location,
         preferences: RoutePreferences,
-        profile: Literal["cycling-regular", "cycling-road", "cycling-mountain"] = "cycling-regular",
+        profile: CyclingProfile = "cycling-regular",
         avoid_coordinates: list[tuple[float, float]] | None = None,
         waypoints: list[Location] | None = None,
     ) -> list[RouteSegment]:
@@ -85,28 +103,26 @@ class RouteGenerator:
             if avoid_polygons:
                 payload["options"] = {"avoid_polygons": avoid_polygons}
 
-        headers = {
-            "Authorization": self.api_key,
-            "Content-Type": "application/json",
-        }
-
         logger.info(f"ORS Request payload: {payload}")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/{profile}/geojson",
-                    json=payload,
-                    headers=headers,
-                )
-                response.raise_for_status()
-                data = response.json()
-                logger.info(f"ORS Response keys: {data.keys()}")
-                if "features" in data and data["features"]:
-                    geom = data["features"][0].get("geometry", {})
-                    coords = geom.get("coordinates", [])
-                    if coords:
-                        logger.info(f"First coordinate: {coords[0]}, length: {len(coords[0])}")
+            client = self._client or get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/{profile}/geojson",
+                json=payload,
+                headers=self._headers,
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            # GeoJSON for long routes is large; parse the raw bytes with
+            # pydantic-core's parser instead of decoding to str for stdlib json
+            data = from_json(response.content)
+            logger.info(f"ORS Response keys: {data.keys()}")
+            if "features" in data and data["features"]:
+                geom = data["features"][0].get("geometry", {})
+                coords = geom.get("coordinates", [])
+                if coords:
+                    logger.info(f"First coordinate: {coords[0]}, length: {len(coords[0])}")
 
         except httpx.HTTPStatusError as e:
             raise RouteGenerationError(
@@ -120,6 +136,38 @@ class RouteGenerator:
         # Parse response and create route segments
         return self._parse_response(data, preferences)
 
+    async def generate_routes_parallel(
+        self,
+        origin: Location,
+        destination: Location,
+        preferences: RoutePreferences,
+        profiles: list[CyclingProfile],
+        waypoints: list[Location] | None = None,
+    ) -> list[list[RouteSegment] | BaseException]:
+        """Generate the same route for several cycling profiles concurrently.
+
+        Args:
+            origin: Starting location.
+            destination: Ending location.
+            preferences: Route preferences.
+            profiles: Cycling profiles to request.
+            waypoints: Optional intermediate waypoints.
+
+        Returns:
+            One entry per profile, in order: the route segments, or the
+            exception raised for that profile (e.g. RouteGenerationError, or
+            CancelledError if that request was cancelled).
+        """
+        return await asyncio.gather(
+            *(
+                self.generate_route(
+                    origin, destination, preferences, profile=profile, waypoints=waypoints
+                )
+                for profile in profiles
+            ),
+            return_exceptions=True,
+        )
+
     def _create_avoid_polygons(
         self,
         coordinates: list[tuple[float, float]],
@@ -179,10 +227,9 @@ class RouteGenerator:
             Polygon coordinates in GeoJSON format [[[lng, lat], ...]].
         """
         # Convert meters to approximate degrees
-        # 1 degree latitude ≈ 111,000 meters
         # 1 degree longitude varies with latitude
-        lat_offset = buffer_m / 111000
-        lng_offset = buffer_m / (111000 * math.cos(math.radians(lat)))
+        lat_offset = buffer_m / METERS_PER_DEGREE_LAT
+        lng_offset = buffer_m / (METERS_PER_DEGREE_LAT * cos(radians(lat)))
 
         # Create rectangle corners (GeoJSON uses [lng, lat] order)
         return [[
@@ -288,12 +335,13 @@ class RouteGenerator:
         # Estimate surface type based on preferences and route type
         surface_type = self._estimate_surface_type(properties, preferences)
 
-        return RouteSegment(
+        # Values come from our own parsing of the ORS response, so skip validation
+        return RouteSegment.model_construct(
             coordinates=coordinates,
             elevations=elevations,
             distance_km=distance_km,
-            elevation_gain_m=ascent,
-            elevation_loss_m=descent,
+            elevation_gain_m=float(ascent),
+            elevation_loss_m=float(descent),
             estimated_duration_min=duration_min,
             surface_type=surface_type,
         )
@@ -325,12 +373,13 @@ class RouteGenerator:
 
         surface_type = self._estimate_surface_type(seg_data, preferences)
 
-        return RouteSegment(
+        # Values come from our own parsing of the ORS response, so skip validation
+        return RouteSegment.model_construct(
             coordinates=segment_coords,
             elevations=segment_elevations,
             distance_km=distance_km,
-            elevation_gain_m=ascent,
-            elevation_loss_m=descent,
+            elevation_gain_m=float(ascent),
+            elevation_loss_m=float(descent),
             estimated_duration_min=duration_min,
             surface_type=surface_type,
         )
@@ -357,10 +406,9 @@ class RouteGenerator:
             if values:
                 # Take most common surface type
                 surface_code = values[0][2] if len(values[0]) > 2 else 0
-                if surface_code in [1, 3]:  # Paved or Asphalt
-                    return "paved"
-                elif surface_code == 2:  # Unpaved
-                    return "gravel"
+                surface = _SURFACE_BY_CODE.get(surface_code)
+                if surface is not None:
+                    return surface
 
         # Fallback based on difficulty preference
         if preferences.difficulty == "hard":
@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures for planner tests."""
 
+import json
+import httpx
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from planner.schemas import Location, RoutePreferences, RouteSegment, WeatherForecast
 
 
@@ -125,3 +128,48 @@ def sample_weather_forecasts():
 def sample_elevation_profile():
     """Sample elevation profile."""
     return [100.0, 120.0, 150.0, 200.0, 280.0, 350.0, 420.0, 450.0, 480.0, 500.0]
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Factory for lightweight HTTP response stand-ins.
+
+    Cheaper than configuring a MagicMock per test; exposes the attributes
+    the planner services read from an httpx.Response.
+    """
+
+    def _make(json_data=None, status_code=200, text="", error=None):
+        def raise_for_status():
+            if error is not None:
+                raise error
+
+        return SimpleNamespace(
+            status_code=status_code,
+            text=text,
+            content=json.dumps(json_data).encode(),
+            json=lambda: json_data,
+            raise_for_status=raise_for_status,
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def mock_client():
+    """Factory for HTTP clients that answer from an in-memory transport.
+
+    Requests go through real httpx request building and responses, without
+    patching httpx or touching the network.
+    """
+
+    def _make(status_code=200, payload=None, text=None, error=None):
+        def handler(request):
+            if error is not None:
+                raise httpx.ConnectError(error, request=request)
+            if text is not None:
+                return httpx.Response(status_code, text=text)
+            return httpx.Response(status_code, json=payload)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return _make
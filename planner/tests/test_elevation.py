@@ -1,14 +1,21 @@
 """Tests for elevation module."""
 
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import httpx
 from planner.elevation import ElevationService, ElevationAPIError
 
+# Route longer than the 1000-point full-resolution limit, shared by the sampling tests
+_BIG_COORDS = [(34.0 + i * 0.0001, 135.0 + i * 0.0001) for i in range(1200)]
+
 
 @pytest.fixture
 def elevation_service():
-    """Create an ElevationService instance."""
+    """Create an ElevationService instance.
+
+    Function-scoped: each service holds its own elevation cache.
+    """
     return ElevationService()
 
 
@@ -21,10 +28,7 @@ def mock_elevation_response():
 class TestElevationService:
     """Tests for ElevationService class."""
 
-    @pytest.mark.asyncio
-    async def test_get_elevation_profile_success(
-        self, elevation_service, mock_elevation_response
-    ):
+    async def test_get_elevation_profile_success(self, mock_elevation_response, mock_client):
         """Test successful elevation profile retrieval."""
         coordinates = [
             (34.573, 135.483),
@@ -34,91 +38,189 @@ class TestElevationService:
             (34.530, 135.560),
         ]
 
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock successful API response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_elevation_response
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-
+        async with mock_client(200, mock_elevation_response) as client:
+            elevation_service = ElevationService(client=client)
             elevations = await elevation_service.get_elevation_profile(coordinates)
 
-            assert len(elevations) == 5
-            assert elevations[0] == 100.0
-            assert elevations[4] == 300.0
+        assert len(elevations) == 5
+        assert elevations[0] == 100.0
+        assert elevations[4] == 300.0
+
+    async def test_get_elevation_profile_uses_injected_client(self, mock_elevation_response):
+        """Test an injected HTTP client is used for API calls."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_elevation_response
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = mock_response
+
+        service = ElevationService(client=client)
+        elevations = await service.get_elevation_profile([(34.573, 135.483)] * 5)
+
+        assert elevations == mock_elevation_response["elevation"]
+        client.get.assert_awaited_once()
+
+    async def test_fetch_elevations_requests_only_cache_misses(self):
+        """Test cached points are served locally and only new points are requested."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        first, second = MagicMock(), MagicMock()
+        first.json.return_value = {"elevation": [100.0, 150.0]}
+        second.json.return_value = {"elevation": [200.0]}
+        client.get.side_effect = [first, second]
+        service = ElevationService(client=client)
+
+        await service._fetch_elevations([(34.573, 135.483), (34.560, 135.500)])
+        elevations = await service._fetch_elevations(
+            [(34.560, 135.500), (34.550, 135.520), (34.573, 135.483)]
+        )
+
+        assert elevations == [150.0, 200.0, 100.0]
+        params = client.get.call_args_list[1].kwargs["params"]
+        assert params == {"latitude": "34.550000", "longitude": "135.520000"}
+
+    async def test_fetch_elevations_splits_into_batches(self):
+        """Test more than MAX_POINTS_PER_REQUEST points are fetched in batches."""
+        coordinates = [(34.0 + i * 0.001, 135.0) for i in range(150)]
+
+        async def fake_get(url, params, timeout):
+            count = len(params["latitude"].split(","))
+            response = MagicMock()
+            response.json.return_value = {"elevation": [float(count)] * count}
+            return response
+
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = fake_get
+        service = ElevationService(client=client)
+
+        elevations = await service._fetch_elevations(coordinates)
+
+        assert client.get.call_count == 2
+        assert elevations == [100.0] * 100 + [50.0] * 50
+
+    async def test_fetch_elevations_short_batch_raises(self):
+        """Test a batch with fewer values than points raises instead of shifting."""
+        coordinates = [(34.0 + i * 0.001, 135.0) for i in range(150)]
+
+        async def fake_get(url, params, timeout):
+            count = len(params["latitude"].split(","))
+            response = MagicMock()
+            response.json.return_value = {"elevation": [0.0] * min(count, 99)}
+            return response
+
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = fake_get
+        service = ElevationService(client=client)
+
+        with pytest.raises(ElevationAPIError, match="99 values for 100 points"):
+            await service._fetch_elevations(coordinates)
+
+    async def test_fetch_elevations_waits_for_batches_before_fallback(self):
+        """Test a failed batch does not leave sibling requests running."""
+        coordinates = [(34.0 + i * 0.001, 135.0) for i in range(250)]
+        finished = []
+
+        async def fake_get(url, params, timeout):
+            if params["latitude"].startswith("34.000000"):
+                raise httpx.ConnectError("boom")
+            await asyncio.sleep(0.01)
+            finished.append(params["latitude"])
+            count = len(params["latitude"].split(","))
+            response = MagicMock()
+            response.json.return_value = {"elevation": [0.0] * count}
+            return response
+
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = fake_get
+        service = ElevationService(client=client)
+
+        elevations = await service._fetch_elevations(coordinates)
+
+        assert len(finished) == 2
+        assert elevations == await service._fallback_elevation_fetch(coordinates)
 
-    @pytest.mark.asyncio
     async def test_get_elevation_profile_empty_coordinates(self, elevation_service):
         """Test elevation profile with empty coordinates."""
         elevations = await elevation_service.get_elevation_profile([])
         assert elevations == []
 
-    @pytest.mark.asyncio
-    async def test_get_elevation_profile_api_error_fallback(self, elevation_service):
+    async def test_get_elevation_profile_api_error_fallback(self, mock_client):
         """Test elevation profile with API error triggers fallback."""
         coordinates = [(34.573, 135.483), (34.560, 135.500)]
 
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock API error
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500", request=MagicMock(), response=mock_response
-            )
-            mock_get.return_value = mock_response
-
-            # Should fall back to estimation
+        # Mock API error; should fall back to estimation
+        async with mock_client(500) as client:
+            elevation_service = ElevationService(client=client)
             elevations = await elevation_service.get_elevation_profile(coordinates)
 
-            assert len(elevations) == 2
-            # Fallback returns estimated values
-            assert all(isinstance(e, float) for e in elevations)
+        assert len(elevations) == 2
+        # Fallback returns estimated values
+        assert all(isinstance(e, float) for e in elevations)
 
-    @pytest.mark.asyncio
-    async def test_get_elevation_profile_sampling(
-        self, elevation_service, mock_elevation_response
-    ):
+    async def test_get_elevation_profile_sampling(self):
         """Test elevation profile sampling for large coordinate lists."""
-        # Create 200 coordinates (exceeds max_points of 100)
-        coordinates = [(34.0 + i * 0.001, 135.0 + i * 0.001) for i in range(200)]
 
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock successful API response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_elevation_response
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+        async def fake_get(url, params, timeout):
+            count = len(params["latitude"].split(","))
+            response = MagicMock()
+            response.json.return_value = {"elevation": [100.0] * count}
+            return response
 
-            elevations = await elevation_service.get_elevation_profile(coordinates)
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = fake_get
+        elevation_service = ElevationService(client=client)
+        elevations = await elevation_service.get_elevation_profile(_BIG_COORDS)
+
+        # Should interpolate back to 1200 points
+        assert len(elevations) == 1200
+
+    async def test_get_elevation_profile_full_resolution(self):
+        """Test routes over 100 points are fetched in batches without sampling."""
+        coordinates = [(34.0 + i * 0.001, 135.0) for i in range(250)]
+
+        async def fake_get(url, params, timeout):
+            lats = params["latitude"].split(",")
+            response = MagicMock()
+            response.json.return_value = {"elevation": [float(lat) for lat in lats]}
+            return response
 
-            # Should interpolate back to 200 points
-            assert len(elevations) == 200
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = fake_get
+        service = ElevationService(client=client)
 
-    @pytest.mark.asyncio
-    async def test_calculate_elevation_stats_gains_and_losses(self, elevation_service):
+        elevations = await service.get_elevation_profile(coordinates)
+
+        assert client.get.call_count == 3
+        assert elevations == pytest.approx([lat for lat, _ in coordinates])
+
+    def test_calculate_elevation_stats_gains_and_losses(self, elevation_service):
         """Test elevation statistics calculation."""
         elevations = [100.0, 150.0, 200.0, 180.0, 220.0, 200.0, 250.0]
 
-        gain, loss = await elevation_service.calculate_elevation_stats(elevations)
+        gain, loss = elevation_service.calculate_elevation_stats(elevations)
 
         # Gains: 50 + 50 + 40 + 50 = 190
         # Losses: 20 + 20 = 40
-        assert gain == pytest.approx(190.0)
+        assert gain == 190.0
         assert loss == pytest.approx(40.0)
 
-    @pytest.mark.asyncio
-    async def test_calculate_elevation_stats_empty(self, elevation_service):
+    def test_calculate_elevation_stats_monotonic_climb(self, elevation_service):
+        """Test a pure climb reports exactly zero loss."""
+        # Gain minus net change gives -5.7e-14 here; the loss must not go negative
+        elevations = [143.9, 176.1, 179.6, 473.5, 476.6]
+
+        gain, loss = elevation_service.calculate_elevation_stats(elevations)
+
+        assert loss == 0.0
+        assert gain == pytest.approx(elevations[-1] - elevations[0])
+
+    def test_calculate_elevation_stats_empty(self, elevation_service):
         """Test elevation statistics with empty list."""
-        gain, loss = await elevation_service.calculate_elevation_stats([])
+        gain, loss = elevation_service.calculate_elevation_stats([])
         assert gain == 0.0
         assert loss == 0.0
 
-    @pytest.mark.asyncio
-    async def test_calculate_elevation_stats_single_point(self, elevation_service):
+    def test_calculate_elevation_stats_single_point(self, elevation_service):
         """Test elevation statistics with single point."""
-        gain, loss = await elevation_service.calculate_elevation_stats([100.0])
+        gain, loss = elevation_service.calculate_elevation_stats([100.0])
         assert gain == 0.0
         assert loss == 0.0
 
@@ -133,14 +235,13 @@ class TestElevationService:
 
     def test_sample_coordinates_exceeds_limit(self, elevation_service):
         """Test coordinate sampling when exceeding limit."""
-        coordinates = [(34.0 + i * 0.001, 135.0 + i * 0.001) for i in range(200)]
-        sampled = elevation_service._sample_coordinates(coordinates, 100)
+        sampled = elevation_service._sample_coordinates(_BIG_COORDS, 100)
 
         # Should sample down to 100 points
         assert len(sampled) == 100
         # Should include first and last points
-        assert sampled[0] == coordinates[0]
-        assert sampled[-1] == coordinates[-1]
+        assert sampled[0] == _BIG_COORDS[0]
+        assert sampled[-1] == _BIG_COORDS[-1]
 
     def test_interpolate_elevations(self, elevation_service):
         """Test elevation interpolation."""
@@ -161,7 +262,6 @@ class TestElevationService:
         result = elevation_service._interpolate_elevations(elevations, 3, 3)
         assert result == elevations
 
-    @pytest.mark.asyncio
     async def test_fallback_elevation_fetch(self, elevation_service):
         """Test fallback elevation estimation."""
         coordinates = [
@@ -2,17 +2,17 @@
 
 import pytest
 from datetime import datetime
-from planner.risk_assessor import RiskAssessor
+from planner.risk_assessor import RiskAssessor, compute_route_stats, compute_weather_stats
 from planner.schemas import RouteSegment, WeatherForecast, RoutePreferences
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def risk_assessor():
     """Create a RiskAssessor instance."""
     return RiskAssessor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_wind_forecast():
     """Weather forecast with high wind."""
     return [
@@ -28,55 +28,7 @@ def high_wind_forecast():
     ]
 
 
-@pytest.fixture
-def rainy_forecast():
-    """Weather forecast with high rain probability."""
-    return [
-        WeatherForecast(
-            time=datetime(2025, 3, 15, 8, 0),
-            temperature=15.0,
-            wind_speed=5.0,
-            wind_direction=180.0,
-            precipitation_probability=75.0,  # High rain probability
-            weather_code=61,
-            description="Slight rain",
-        )
-    ]
-
-
-@pytest.fixture
-def cold_forecast():
-    """Weather forecast with cold temperature."""
-    return [
-        WeatherForecast(
-            time=datetime(2025, 3, 15, 8, 0),
-            temperature=2.0,  # Cold
-            wind_speed=5.0,
-            wind_direction=180.0,
-            precipitation_probability=10.0,
-            weather_code=0,
-            description="Clear sky",
-        )
-    ]
-
-
-@pytest.fixture
-def hot_forecast():
-    """Weather forecast with hot temperature."""
-    return [
-        WeatherForecast(
-            time=datetime(2025, 3, 15, 13, 0),
-            temperature=38.0,  # Hot
-            wind_speed=5.0,
-            wind_direction=180.0,
-            precipitation_probability=10.0,
-            weather_code=0,
-            description="Clear sky",
-        )
-    ]
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def high_elevation_segments():
     """Route segments with high elevation gain."""
     return [
@@ -115,65 +67,52 @@ class TestRiskAssessor:
         # Warnings list should exist (may be empty for mild conditions)
         assert isinstance(warnings, list)
 
-    def test_assess_high_wind(
-        self, risk_assessor, sample_route_segments, high_wind_forecast, sample_preferences
-    ):
-        """Test assessment with high wind conditions."""
-        warnings, gear = risk_assessor.assess_route(
-            sample_route_segments, high_wind_forecast, sample_preferences
-        )
-
-        # Should warn about wind
-        wind_warnings = [w for w in warnings if "wind" in w.lower()]
-        assert len(wind_warnings) > 0
-
-        # Should recommend wind gear
-        assert any("wind" in g.lower() for g in gear)
-
-    def test_assess_rain(
-        self, risk_assessor, sample_route_segments, rainy_forecast, sample_preferences
-    ):
-        """Test assessment with rainy conditions."""
-        warnings, gear = risk_assessor.assess_route(
-            sample_route_segments, rainy_forecast, sample_preferences
-        )
-
-        # Should warn about rain
-        rain_warnings = [w for w in warnings if "rain" in w.lower()]
-        assert len(rain_warnings) > 0
-
-        # Should recommend rain gear
-        assert any("rain" in g.lower() for g in gear)
-
-    def test_assess_cold_weather(
-        self, risk_assessor, sample_route_segments, cold_forecast, sample_preferences
+    @pytest.mark.parametrize(
+        ("forecast_fields", "warning_keywords", "gear_keywords"),
+        [
+            ({"wind_speed": 12.0, "precipitation_probability": 20.0}, ("wind",), ("wind",)),
+            (
+                {"precipitation_probability": 75.0, "weather_code": 61},
+                ("rain",),
+                ("rain",),
+            ),
+            ({"temperature": 2.0}, ("cold", "temperature"), ("thermal", "gloves")),
+            ({"temperature": 38.0}, ("temperature", "high"), ("sun", "water")),
+        ],
+        ids=["high_wind", "rain", "cold", "hot"],
+    )
+    def test_assess_adverse_weather(
+        self,
+        risk_assessor,
+        sample_route_segments,
+        sample_preferences,
+        forecast_fields,
+        warning_keywords,
+        gear_keywords,
     ):
-        """Test assessment with cold weather."""
-        warnings, gear = risk_assessor.assess_route(
-            sample_route_segments, cold_forecast, sample_preferences
+        """Test adverse weather produces matching warnings and gear."""
+        forecast = WeatherForecast(
+            **{
+                "time": datetime(2025, 3, 15, 8, 0),
+                "temperature": 15.0,
+                "wind_speed": 5.0,
+                "wind_direction": 180.0,
+                "precipitation_probability": 10.0,
+                "weather_code": 0,
+                "description": "Clear sky",
+                **forecast_fields,
+            }
         )
 
-        # Should warn about cold
-        cold_warnings = [w for w in warnings if "cold" in w.lower() or "temperature" in w.lower()]
-        assert len(cold_warnings) > 0
-
-        # Should recommend warm gear
-        assert any("thermal" in g.lower() or "gloves" in g.lower() for g in gear)
-
-    def test_assess_hot_weather(
-        self, risk_assessor, sample_route_segments, hot_forecast, sample_preferences
-    ):
-        """Test assessment with hot weather."""
         warnings, gear = risk_assessor.assess_route(
-            sample_route_segments, hot_forecast, sample_preferences
+            sample_route_segments, [forecast], sample_preferences
         )
 
-        # Should warn about heat
-        heat_warnings = [w for w in warnings if "temperature" in w.lower() or "high" in w.lower()]
-        assert len(heat_warnings) > 0
+        # Should warn about the condition
+        assert any(k in w.lower() for w in warnings for k in warning_keywords)
 
-        # Should recommend sun protection
-        assert any("sun" in g.lower() or "water" in g.lower() for g in gear)
+        # Should recommend gear for it
+        assert any(k in g.lower() for g in gear for k in gear_keywords)
 
     def test_assess_high_elevation(
         self,
@@ -291,6 +230,44 @@ class TestRiskAssessor:
         assert score > 30
         assert score <= 100
 
+    def test_calculate_risk_score_with_precomputed_stats(
+        self, risk_assessor, high_elevation_segments, high_wind_forecast
+    ):
+        """Test precomputed statistics give the same score as raw inputs."""
+        weather_stats = compute_weather_stats(high_wind_forecast)
+        route_stats = compute_route_stats(high_elevation_segments)
+
+        score = risk_assessor.calculate_risk_score(
+            [], [], weather_stats=weather_stats, route_stats=route_stats
+        )
+
+        assert score == risk_assessor.calculate_risk_score(
+            high_elevation_segments, high_wind_forecast
+        )
+        assert weather_stats.max_wind == max(f.wind_speed for f in high_wind_forecast)
+        assert route_stats.total_distance_km == pytest.approx(
+            sum(seg.distance_km for seg in high_elevation_segments)
+        )
+
+    def test_assess_route_with_precomputed_stats(
+        self, risk_assessor, high_elevation_segments, high_wind_forecast, sample_preferences
+    ):
+        """Test assess_route and calculate_risk_score can share one set of stats."""
+        weather_stats = compute_weather_stats(high_wind_forecast)
+        route_stats = compute_route_stats(high_elevation_segments)
+
+        result = risk_assessor.assess_route(
+            high_elevation_segments,
+            high_wind_forecast,
+            sample_preferences,
+            weather_stats=weather_stats,
+            route_stats=route_stats,
+        )
+
+        assert result == risk_assessor.assess_route(
+            high_elevation_segments, high_wind_forecast, sample_preferences
+        )
+
     def test_calculate_risk_score_boundaries(self, risk_assessor):
         """Test that risk score stays within 0-100 bounds."""
         # Create extreme conditions
@@ -1,13 +1,13 @@
 """Tests for route_generator module."""
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import MagicMock
 import httpx
 from planner.route_generator import RouteGenerator, RouteGenerationError
 from planner.schemas import Location, RoutePreferences
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def route_generator():
     """Create a RouteGenerator instance with mock API key."""
     return RouteGenerator(api_key="test_api_key")
@@ -73,52 +73,120 @@ class TestRouteGenerator:
         with pytest.raises(ValueError, match="OpenRouteService API key required"):
             RouteGenerator()
 
-    @pytest.mark.asyncio
     async def test_generate_route_success(
         self,
-        route_generator,
         sample_location_origin,
         sample_location_destination,
         sample_preferences,
         mock_ors_response,
+        mock_client,
     ):
         """Test successful route generation."""
-        with patch("httpx.AsyncClient.post") as mock_post:
-            # Mock successful API response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_ors_response
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
-
+        async with mock_client(200, mock_ors_response) as client:
+            route_generator = RouteGenerator(api_key="test_api_key", client=client)
             segments = await route_generator.generate_route(
                 sample_location_origin, sample_location_destination, sample_preferences
             )
 
-            assert len(segments) > 0
-            assert segments[0].distance_km == 50.0
-            assert segments[0].elevation_gain_m == 800.0
-            assert segments[0].surface_type in ["paved", "gravel", "dirt"]
+        assert len(segments) > 0
+        assert segments[0].distance_km == 50.0
+        assert segments[0].elevation_gain_m == 800.0
+        assert segments[0].surface_type in ["paved", "gravel", "dirt"]
+
+    async def test_generate_route_uses_injected_client(
+        self,
+        sample_location_origin,
+        sample_location_destination,
+        sample_preferences,
+        mock_ors_response,
+        make_response,
+    ):
+        """Test an injected HTTP client is used with the ORS auth header."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.post.return_value = make_response(mock_ors_response)
+
+        generator = RouteGenerator(api_key="test_key", client=client)
+        segments = await generator.generate_route(
+            sample_location_origin, sample_location_destination, sample_preferences
+        )
+
+        assert len(segments) > 0
+        client.post.assert_awaited_once()
+        assert client.post.call_args.kwargs["headers"]["Authorization"] == "test_key"
+
+    async def test_generate_routes_parallel(
+        self,
+        sample_location_origin,
+        sample_location_destination,
+        sample_preferences,
+        mock_ors_response,
+        make_response,
+    ):
+        """Test profiles are requested concurrently and failures are returned per profile."""
+
+        async def fake_post(url, **kwargs):
+            if "cycling-mountain" in url:
+                raise httpx.RequestError("connection failed")
+            return make_response(mock_ors_response)
+
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.post.side_effect = fake_post
+        generator = RouteGenerator(api_key="test_key", client=client)
+
+        results = await generator.generate_routes_parallel(
+            sample_location_origin,
+            sample_location_destination,
+            sample_preferences,
+            profiles=["cycling-road", "cycling-mountain"],
+        )
+
+        assert client.post.await_count == 2
+        assert results[0][0].distance_km == 50.0
+        assert isinstance(results[1], RouteGenerationError)
+
+    async def test_generate_routes_parallel_one_profile_fails(
+        self,
+        sample_location_origin,
+        sample_location_destination,
+        sample_preferences,
+        mock_ors_response,
+        make_response,
+    ):
+        """Test one failing profile does not affect the routes of the others."""
+        response = httpx.Response(500, text="Server error")
+        error = httpx.HTTPStatusError("Server error", request=MagicMock(), response=response)
+
+        async def fake_post(url, **kwargs):
+            if "cycling-mountain" in url:
+                return make_response(status_code=500, text="Server error", error=error)
+            return make_response(mock_ors_response)
+
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.post.side_effect = fake_post
+        generator = RouteGenerator(api_key="test_key", client=client)
+
+        road, mountain, regular = await generator.generate_routes_parallel(
+            sample_location_origin,
+            sample_location_destination,
+            sample_preferences,
+            profiles=["cycling-road", "cycling-mountain", "cycling-regular"],
+        )
+
+        assert isinstance(mountain, RouteGenerationError)
+        assert str(mountain) == "OpenRouteService API error: 500 - Server error"
+        assert road[0].distance_km == 50.0
+        assert regular[0].distance_km == 50.0
 
-    @pytest.mark.asyncio
     async def test_generate_route_api_error(
         self,
-        route_generator,
         sample_location_origin,
         sample_location_destination,
         sample_preferences,
+        mock_client,
     ):
         """Test route generation with API error."""
-        with patch("httpx.AsyncClient.post") as mock_post:
-            # Mock API error
-            mock_response = MagicMock()
-            mock_response.status_code = 401
-            mock_response.text = "Unauthorized"
-            mock_post.return_value = mock_response
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "401", request=MagicMock(), response=mock_response
-            )
-
+        async with mock_client(401, text="Unauthorized") as client:
+            route_generator = RouteGenerator(api_key="test_api_key", client=client)
             with pytest.raises(RouteGenerationError, match="OpenRouteService API error"):
                 await route_generator.generate_route(
                     sample_location_origin,
@@ -126,19 +194,16 @@ class TestRouteGenerator:
                     sample_preferences,
                 )
 
-    @pytest.mark.asyncio
     async def test_generate_route_network_error(
         self,
-        route_generator,
         sample_location_origin,
         sample_location_destination,
         sample_preferences,
+        mock_client,
     ):
         """Test route generation with network error."""
-        with patch("httpx.AsyncClient.post") as mock_post:
-            # Mock network error
-            mock_post.side_effect = httpx.RequestError("Connection failed")
-
+        async with mock_client(error="Connection failed") as client:
+            route_generator = RouteGenerator(api_key="test_api_key", client=client)
             with pytest.raises(
                 RouteGenerationError, match="Failed to connect to OpenRouteService"
             ):
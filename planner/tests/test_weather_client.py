@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import httpx
 from planner.weather_client import WeatherClient, WeatherAPIError
 from planner.schemas import Location
@@ -10,7 +10,10 @@ from planner.schemas import Location
 
 @pytest.fixture
 def weather_client():
-    """Create a WeatherClient instance."""
+    """Create a WeatherClient instance.
+
+    Function-scoped: each client holds its own forecast cache.
+    """
     return WeatherClient()
 
 
@@ -37,70 +40,84 @@ def mock_openmeteo_response():
 class TestWeatherClient:
     """Tests for WeatherClient class."""
 
-    @pytest.mark.asyncio
     async def test_get_forecast_success(
-        self, weather_client, sample_location_origin, mock_openmeteo_response
+        self, sample_location_origin, mock_openmeteo_response, mock_client
     ):
         """Test successful weather forecast retrieval."""
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock successful API response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_openmeteo_response
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-
+        async with mock_client(200, mock_openmeteo_response) as client:
+            weather_client = WeatherClient(client=client)
             start_time = datetime(2025, 3, 15, 7, 0)
             forecasts = await weather_client.get_forecast(
                 sample_location_origin, start_time, hours=4
             )
 
-            assert len(forecasts) == 4
-            assert forecasts[0].temperature == 12.0
-            assert forecasts[0].wind_speed == 4.0
-            assert forecasts[0].weather_code == 0
-            assert forecasts[0].description == "Clear sky"
+        assert len(forecasts) == 4
+        assert forecasts[0].temperature == 12.0
+        assert forecasts[0].wind_speed == 4.0
+        assert forecasts[0].weather_code == 0
+        assert forecasts[0].description == "Clear sky"
 
-    @pytest.mark.asyncio
-    async def test_get_forecast_api_error(
-        self, weather_client, sample_location_origin
+    async def test_get_forecast_uses_injected_client(
+        self, sample_location_origin, mock_openmeteo_response, make_response
     ):
-        """Test forecast retrieval with API error."""
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock API error
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_get.return_value = mock_response
-            mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "500", request=MagicMock(), response=mock_response
-            )
+        """Test an injected HTTP client is used for API calls."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = make_response(mock_openmeteo_response)
+
+        weather_client = WeatherClient(client=client)
+        start_time = datetime(2025, 3, 15, 7, 0)
+        forecasts = await weather_client.get_forecast(
+            sample_location_origin, start_time, hours=4
+        )
+
+        assert [f.temperature for f in forecasts] == [12.0, 14.0, 16.0, 18.0]
+        client.get.assert_awaited_once()
+
+    async def test_get_forecast_reuses_cached_response(
+        self, mock_openmeteo_response, make_response
+    ):
+        """Test nearby locations within the cache TTL share one API call."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = make_response(mock_openmeteo_response)
+        weather_client = WeatherClient(client=client)
+        start_time = datetime(2025, 3, 15, 7, 0)
 
+        first = await weather_client.get_forecast(
+            Location(lat=34.573, lng=135.483), start_time, hours=4
+        )
+        second = await weather_client.get_forecast(
+            Location(lat=34.591, lng=135.471), start_time, hours=4
+        )
+        await weather_client.get_forecast(
+            Location(lat=34.396, lng=135.757), start_time, hours=4
+        )
+
+        assert second == first
+        assert client.get.await_count == 2
+        params = client.get.call_args_list[0].kwargs["params"]
+        assert (params["latitude"], params["longitude"]) == (34.6, 135.5)
+
+    async def test_get_forecast_api_error(self, sample_location_origin, mock_client):
+        """Test forecast retrieval with API error."""
+        async with mock_client(500, text="Internal Server Error") as client:
+            weather_client = WeatherClient(client=client)
             start_time = datetime(2025, 3, 15, 7, 0)
             with pytest.raises(WeatherAPIError, match="OpenMeteo API error"):
                 await weather_client.get_forecast(
                     sample_location_origin, start_time, hours=24
                 )
 
-    @pytest.mark.asyncio
-    async def test_get_forecast_network_error(
-        self, weather_client, sample_location_origin
-    ):
+    async def test_get_forecast_network_error(self, sample_location_origin, mock_client):
         """Test forecast retrieval with network error."""
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock network error
-            mock_get.side_effect = httpx.RequestError("Connection failed")
-
+        async with mock_client(error="Connection failed") as client:
+            weather_client = WeatherClient(client=client)
             start_time = datetime(2025, 3, 15, 7, 0)
             with pytest.raises(WeatherAPIError, match="Failed to connect to OpenMeteo"):
                 await weather_client.get_forecast(
                     sample_location_origin, start_time, hours=24
                 )
 
-    @pytest.mark.asyncio
-    async def test_get_route_forecast(
-        self, weather_client, mock_openmeteo_response
-    ):
+    async def test_get_route_forecast(self, mock_openmeteo_response, mock_client):
         """Test route forecast with multiple locations."""
         locations = [
             Location(lat=34.573, lng=135.483, name="Start"),
@@ -108,26 +125,19 @@ class TestWeatherClient:
             Location(lat=34.396, lng=135.757, name="End"),
         ]
 
-        with patch("httpx.AsyncClient.get") as mock_get:
-            # Mock successful API response
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_openmeteo_response
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
-
+        async with mock_client(200, mock_openmeteo_response) as client:
+            weather_client = WeatherClient(client=client)
             start_time = datetime(2025, 3, 15, 7, 0)
             forecasts = await weather_client.get_route_forecast(
                 locations, start_time, duration_hours=4
             )
 
-            # Should get forecasts for sampled locations
-            assert len(forecasts) > 0
-            # Forecasts should be sorted by time
-            for i in range(len(forecasts) - 1):
-                assert forecasts[i].time <= forecasts[i + 1].time
+        # Should get forecasts for sampled locations
+        assert len(forecasts) > 0
+        # Forecasts should be sorted by time
+        for i in range(len(forecasts) - 1):
+            assert forecasts[i].time <= forecasts[i + 1].time
 
-    @pytest.mark.asyncio
     async def test_get_route_forecast_empty_locations(self, weather_client):
         """Test route forecast with empty locations list."""
         start_time = datetime(2025, 3, 15, 7, 0)
@@ -1,10 +1,30 @@
 """Weather forecasting using OpenMeteo API."""
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+from typing import Any
 import httpx
+from pydantic_core import from_json
+from planner.http import get_http_client
 from planner.schemas import WeatherForecast, Location
 
 
+def _padded(values: list[float], length: int, default: float) -> list[float]:
+    """Extend a value series with defaults so it covers every timestamp.
+
+    Args:
+        values: Hourly values from the API (may be shorter than the time series).
+        length: Number of timestamps.
+        default: Value used for missing entries.
+
+    Returns:
+        List with at least ``length`` entries.
+    """
+    missing = length - len(values)
+    return values + [default] * missing if missing > 0 else values
+
+
 class WeatherAPIError(Exception):
     """Raised when weather API request fails."""
 
@@ -16,6 +36,28 @@ class WeatherClient:
 
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
+    # Coordinates are rounded to 0.1° (~11 km, about one forecast grid cell)
+    # so nearby points share a cached response
+    COORD_DECIMALS = 1
+
+    # Query parameters shared by every forecast request
+    _STATIC_PARAMS = {
+        "hourly": ",".join(
+            (
+                "temperature_2m",
+                "wind_speed_10m",
+                "wind_direction_10m",
+                "precipitation_probability",
+                "weather_code",
+            )
+        ),
+        "timezone": "UTC",  # Request UTC timezone to match our datetime objects
+    }
+
+    # Maximum number of cached API responses and how long they stay fresh
+    CACHE_SIZE = 256
+    CACHE_TTL_S = 600.0
+
     # WMO Weather interpretation codes (Japanese)
     WEATHER_CODES = {
         0: "快晴",
@@ -48,6 +90,21 @@ class WeatherClient:
         99: "雷雨（強い雹）",
     }
 
+    # WMO codes are 0-99; index a dense table instead of hashing into the dict
+    _WEATHER_CODE_TABLE: tuple[str | None, ...] = tuple(map(WEATHER_CODES.get, range(100)))
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize the weather client.
+
+        Args:
+            client: HTTP client to use. If None, the shared planner client is used.
+        """
+        self._client = client
+        # LRU cache of raw API responses: key -> (monotonic fetch time, data)
+        self._cache: OrderedDict[tuple[float, float, int], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
     async def get_forecast(
         self,
         location: Location,
@@ -68,29 +125,34 @@ class WeatherClient:
             WeatherAPIError: If API request fails.
         """
         # Ensure start_time is timezone-aware
-        from datetime import timezone
         if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=timezone.utc)
+            start_time = start_time.replace(tzinfo=UTC)
+
+        lat = round(location.lat, self.COORD_DECIMALS)
+        lng = round(location.lng, self.COORD_DECIMALS)
+        forecast_days = min(7, (hours // 24) + 1)
+
+        # Responses don't depend on start_time (filtering happens in
+        # _parse_forecast), so they can be shared across calls
+        key = (lat, lng, forecast_days)
+        cached = self._cache.get(key)
+        if cached is not None and monotonic() - cached[0] < self.CACHE_TTL_S:
+            self._cache.move_to_end(key)
+            return self._parse_forecast(cached[1], start_time, hours)
 
         params = {
-            "latitude": location.lat,
-            "longitude": location.lng,
-            "hourly": [
-                "temperature_2m",
-                "wind_speed_10m",
-                "wind_direction_10m",
-                "precipitation_probability",
-                "weather_code",
-            ],
-            "forecast_days": min(7, (hours // 24) + 1),
-            "timezone": "UTC",  # Request UTC timezone to match our datetime objects
+            **self._STATIC_PARAMS,
+            "latitude": lat,
+            "longitude": lng,
+            "forecast_days": forecast_days,
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(self.BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = self._client or get_http_client()
+            response = await client.get(self.BASE_URL, params=params, timeout=15.0)
+            response.raise_for_status()
+            # pydantic-core's parser is faster than stdlib json on the numeric arrays
+            data = from_json(response.content)
 
         except httpx.HTTPStatusError as e:
             raise WeatherAPIError(
@@ -99,6 +161,11 @@ class WeatherClient:
         except httpx.RequestError as e:
             raise WeatherAPIError(f"Failed to connect to OpenMeteo: {e}") from e
 
+        self._cache[key] = (monotonic(), data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
         return self._parse_forecast(data, start_time, hours)
 
     async def get_route_forecast(
@@ -127,9 +194,8 @@ class WeatherClient:
             return []
 
         # Ensure start_time is timezone-aware
-        from datetime import timezone
         if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=timezone.utc)
+            start_time = start_time.replace(tzinfo=UTC)
 
         # Use a representative location (middle of route) for weather forecast
         # to avoid duplicates and provide relevant weather along the route
@@ -164,11 +230,13 @@ class WeatherClient:
         """
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
-        temperatures = hourly.get("temperature_2m", [])
-        wind_speeds = hourly.get("wind_speed_10m", [])
-        wind_directions = hourly.get("wind_direction_10m", [])
-        precip_probs = hourly.get("precipitation_probability", [])
-        weather_codes = hourly.get("weather_code", [])
+        # Pad missing data once up front instead of bounds-checking every row
+        n = len(times)
+        temperatures = _padded(hourly.get("temperature_2m", []), n, 0.0)
+        wind_speeds = _padded(hourly.get("wind_speed_10m", []), n, 0.0)
+        wind_directions = _padded(hourly.get("wind_direction_10m", []), n, 0.0)
+        precip_probs = _padded(hourly.get("precipitation_probability", []), n, 0.0)
+        weather_codes = _padded(hourly.get("weather_code", []), n, 0)
 
         forecasts = []
 
@@ -176,37 +244,38 @@ class WeatherClient:
         # Calculate end_time
         end_time = start_time + timedelta(hours=hours)
 
+        # Known codes are looked up inline; the method only handles unknown ones
+        code_table = self._WEATHER_CODE_TABLE
+
         for i, time_str in enumerate(times):
-            # Parse time (ISO 8601 format)
+            # Parse time (ISO 8601 format; Python 3.11+ accepts a "Z" suffix)
             # OpenMeteo may return times without timezone suffix even when timezone=UTC
-            if time_str.endswith("Z"):
-                time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-            elif "+" in time_str or time_str.count("-") > 2:  # Has timezone offset
-                time = datetime.fromisoformat(time_str)
-            else:
+            time = datetime.fromisoformat(time_str)
+            if time.tzinfo is None:
                 # No timezone info, assume UTC (since we requested timezone=UTC)
-                from datetime import timezone as tz
-                time = datetime.fromisoformat(time_str).replace(tzinfo=tz.utc)
+                time = time.replace(tzinfo=UTC)
 
-            # Filter to requested time range
-            if time < start_time or time > end_time:
+            # Filter to requested time range. Hourly times are ascending, so
+            # nothing after the first row past end_time can match.
+            if time > end_time:
+                break
+            if time < start_time:
                 continue
 
-            # Extract values (handle missing data)
-            temperature = temperatures[i] if i < len(temperatures) else 0.0
-            wind_speed = wind_speeds[i] if i < len(wind_speeds) else 0.0
-            wind_direction = wind_directions[i] if i < len(wind_directions) else 0.0
-            precip_prob = precip_probs[i] if i < len(precip_probs) else 0.0
-            weather_code = int(weather_codes[i]) if i < len(weather_codes) else 0
+            weather_code = int(weather_codes[i])
+            description = code_table[weather_code] if 0 <= weather_code < 100 else None
+            if description is None:
+                description = self._get_weather_description(weather_code)
 
-            forecast = WeatherForecast(
+            # Values are coerced here, so skip per-row model validation
+            forecast = WeatherForecast.model_construct(
                 time=time,
-                temperature=temperature,
-                wind_speed=wind_speed,
-                wind_direction=wind_direction,
-                precipitation_probability=precip_prob,
+                temperature=float(temperatures[i]),
+                wind_speed=float(wind_speeds[i]),
+                wind_direction=float(wind_directions[i]),
+                precipitation_probability=float(precip_probs[i]),
                 weather_code=weather_code,
-                description=self._get_weather_description(weather_code),
+                description=description,
             )
             forecasts.append(forecast)
 
@@ -221,4 +290,6 @@ class WeatherClient:
         Returns:
             Weather description string.
         """
-        return self.WEATHER_CODES.get(code, f"Unknown (code {code})")
+        description = self._WEATHER_CODE_TABLE[code] if 0 <= code < 100 else None
+        # Only build the fallback string for unknown codes
+        return description if description is not None else f"Unknown (code {code})"